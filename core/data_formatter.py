@@ -4,7 +4,13 @@ Handles formatting of dataset data for display in different formats
 """
 
 import numpy as np
-from typing import Any, Tuple, List
+from typing import Any, Tuple, List, Optional
+
+from core.h5_file_handler import DatasetInfo
+
+# Element-wise str() as a ufunc, so Python objects and structured records
+# convert without an explicit Python loop
+_to_str = np.frompyfunc(str, 1, 1)
 
 
 class DataFormatter:
@@ -12,7 +18,7 @@ class DataFormatter:
     
     @staticmethod
     def format_for_display(data: Any, is_truncated: bool, original_shape: Tuple, 
-                          max_display_width: int = 80) -> str:
+                          max_display_width: int = 80, total_size: Optional[int] = None) -> str:
         """
         Format data for display in the inspector
         
@@ -21,6 +27,8 @@ class DataFormatter:
             is_truncated: Whether the data was truncated
             original_shape: Original shape of the dataset
             max_display_width: Maximum width for display lines
+            total_size: Total number of elements in the dataset (e.g. DatasetInfo.size);
+                        computed from original_shape when not given
             
         Returns:
             Formatted string for display
@@ -32,177 +40,184 @@ class DataFormatter:
         if not isinstance(data, np.ndarray):
             data = np.array(data)
         
+        # Only the truncation footers report the total element count
+        if total_size is None and is_truncated:
+            total_size = int(np.prod(original_shape))
+        
         # Handle different data types
         if data.dtype.kind in ('S', 'U'):  # String data
-            return DataFormatter._format_string_data(data, is_truncated, original_shape)
-        elif np.issubdtype(data.dtype, np.number):  # Numeric data
-            return DataFormatter._format_numeric_data(data, is_truncated, original_shape, max_display_width)
+            return DataFormatter._format_string_data(data, is_truncated, original_shape, total_size)
+        elif data.dtype.kind in ('i', 'u', 'f', 'c'):  # Numeric data
+            return DataFormatter._format_numeric_data(data, is_truncated, original_shape, max_display_width, total_size)
         else:  # Other data types
-            return DataFormatter._format_generic_data(data, is_truncated, original_shape, max_display_width)
+            return DataFormatter._format_generic_data(data, is_truncated, original_shape, max_display_width, total_size)
     
     @staticmethod
-    def _format_string_data(data: np.ndarray, is_truncated: bool, original_shape: Tuple) -> str:
+    def _format_string_data(data: np.ndarray, is_truncated: bool, original_shape: Tuple,
+                            total_size: Optional[int]) -> str:
         """Format string data for display"""
+        # Decode byte strings in a single vectorized call
+        if data.dtype.kind == 'S':
+            data = np.char.decode(data, 'utf-8', errors='replace')
+        
         if data.ndim == 1:
             # 1D string array - display as vertical column
-            result = "String Values:\n" + "-" * 50 + "\n"
-            for i, item in enumerate(data):
-                # Decode bytes to string if necessary
-                if isinstance(item, bytes):
-                    item = item.decode('utf-8', errors='replace')
-                result += f"[{i:4d}]  {item}\n"
+            parts = ["String Values:\n" + "-" * 50 + "\n"]
+            for i, item in enumerate(data.tolist()):
+                parts.append(f"[{i:4d}]  {item}\n")
             
             if is_truncated:
-                result += f"\n... (showing first {len(data)} of {np.prod(original_shape)} total elements)"
+                parts.append(f"\n... (showing first {len(data)} of {total_size} total elements)")
             
-            return result
+            return "".join(parts)
         
         elif data.ndim == 2:
-            # 2D string array - display as table
-            result = "String Array (2D):\n" + "-" * 50 + "\n"
-            for i, row in enumerate(data):
-                row_str = "  ".join([
-                    (item.decode('utf-8', errors='replace') if isinstance(item, bytes) else str(item))[:20]
-                    for item in row
-                ])
-                result += f"[{i:4d}]  {row_str}\n"
+            # 2D string array - display as table, cells truncated to 20 characters
+            parts = ["String Array (2D):\n" + "-" * 50 + "\n"]
+            for i, row in enumerate(data.astype('<U20').tolist()):
+                row_str = "  ".join(row)
+                parts.append(f"[{i:4d}]  {row_str}\n")
             
             if is_truncated:
-                result += f"\n... (showing first {data.shape[0]} rows of {original_shape[0]} total rows)"
+                parts.append(f"\n... (showing first {data.shape[0]} rows of {original_shape[0]} total rows)")
             
-            return result
+            return "".join(parts)
         
         else:
             # Multi-dimensional - flatten and display
-            flattened = data.flatten()
-            result = f"String Array ({data.ndim}D, flattened view):\n" + "-" * 50 + "\n"
-            for i, item in enumerate(flattened):
-                if isinstance(item, bytes):
-                    item = item.decode('utf-8', errors='replace')
-                result += f"[{i:4d}]  {item}\n"
+            flattened = data.ravel()
+            parts = [f"String Array ({data.ndim}D, flattened view):\n" + "-" * 50 + "\n"]
+            for i, item in enumerate(flattened.tolist()):
+                parts.append(f"[{i:4d}]  {item}\n")
             
             if is_truncated:
-                result += f"\n... (showing first {len(flattened)} of {np.prod(original_shape)} total elements)"
+                parts.append(f"\n... (showing first {len(flattened)} of {total_size} total elements)")
             
-            return result
+            return "".join(parts)
+    
+    @staticmethod
+    def _format_numeric_cells(data: np.ndarray, is_float: bool) -> np.ndarray:
+        """Format every element of a numeric array as a string in one vectorized pass"""
+        if is_float:
+            return np.char.mod('%.6g', data)
+        return data.astype(str)
     
     @staticmethod
     def _format_numeric_data(data: np.ndarray, is_truncated: bool, original_shape: Tuple, 
-                           max_display_width: int) -> str:
+                           max_display_width: int, total_size: Optional[int]) -> str:
         """Format numeric data for display"""
+        # Resolve the dtype category once for every branch below
+        is_float = data.dtype.kind == 'f'
+        is_int = data.dtype.kind in ('i', 'u')
+        
         if data.ndim == 1:
             # 1D numeric array - display as vertical column
-            result = "Numeric Values:\n" + "-" * 50 + "\n"
-            for i, item in enumerate(data):
-                # Format numbers appropriately
-                if np.issubdtype(data.dtype, np.integer):
-                    result += f"[{i:4d}]  {item}\n"
-                elif np.issubdtype(data.dtype, np.floating):
-                    result += f"[{i:4d}]  {item:.6g}\n"
-                else:
-                    result += f"[{i:4d}]  {item}\n"
+            cells = DataFormatter._format_numeric_cells(data, is_float)
+            parts = ["Numeric Values:\n" + "-" * 50 + "\n"]
+            for i, item in enumerate(cells.tolist()):
+                parts.append(f"[{i:4d}]  {item}\n")
             
             if is_truncated:
-                result += f"\n... (showing first {len(data)} of {np.prod(original_shape)} total elements)"
+                parts.append(f"\n... (showing first {len(data)} of {total_size} total elements)")
             
-            return result
+            return "".join(parts)
         
         elif data.ndim == 2:
             # 2D numeric array - display as formatted table
-            result = "Numeric Array (2D):\n" + "-" * 50 + "\n"
-            
-            # Calculate column widths
-            col_widths = []
-            for col in range(data.shape[1]):
-                max_width = max(len(f"{item:.6g}" if np.issubdtype(data.dtype, np.floating) 
-                                   else str(item)) for item in data[:, col])
-                col_widths.append(min(max_width, 15))  # Cap at 15 characters
+            parts = ["Numeric Array (2D):\n" + "-" * 50 + "\n"]
+            
+            # Format all cells at once and right-align each column to its widest
+            # value (capped at 15 characters)
+            cells = DataFormatter._format_numeric_cells(data, is_float)
+            if cells.size:
+                if is_int:
+                    # The widest integer in a column is always its min or max,
+                    # so only the extremes need measuring
+                    col_widths = np.maximum(np.char.str_len(data.min(axis=0).astype(str)),
+                                            np.char.str_len(data.max(axis=0).astype(str)))
+                else:
+                    col_widths = np.char.str_len(cells).max(axis=0)
+                cells = np.char.rjust(cells, np.minimum(col_widths, 15))
             
             # Format each row
-            for i, row in enumerate(data):
-                row_parts = []
-                for j, item in enumerate(row):
-                    if np.issubdtype(data.dtype, np.floating):
-                        formatted = f"{item:.6g}".rjust(col_widths[j])
-                    else:
-                        formatted = str(item).rjust(col_widths[j])
-                    row_parts.append(formatted)
-                
-                result += f"[{i:4d}]  " + "  ".join(row_parts) + "\n"
+            for i, row_cells in enumerate(cells.tolist()):
+                parts.append(f"[{i:4d}]  " + "  ".join(row_cells) + "\n")
             
             if is_truncated:
-                result += f"\n... (showing first {data.shape[0]} rows of {original_shape[0]} total rows)"
+                parts.append(f"\n... (showing first {data.shape[0]} rows of {original_shape[0]} total rows)")
             
-            return result
+            return "".join(parts)
         
         else:
             # Multi-dimensional - show summary and some values
-            result = f"Numeric Array ({data.ndim}D):\n" + "-" * 50 + "\n"
-            result += f"Shape: {data.shape}\n"
-            result += f"Min: {np.min(data):.6g}\n"
-            result += f"Max: {np.max(data):.6g}\n"
-            result += f"Mean: {np.mean(data):.6g}\n"
-            result += f"Std: {np.std(data):.6g}\n\n"
+            parts = [f"Numeric Array ({data.ndim}D):\n" + "-" * 50 + "\n"]
+            parts.append(f"Shape: {data.shape}\n")
+            parts.append(f"Min: {data.min():.6g}\n")
+            parts.append(f"Max: {data.max():.6g}\n")
+            parts.append(f"Mean: {data.mean():.6g}\n")
+            parts.append(f"Std: {data.std():.6g}\n\n")
             
             # Show some flattened values
-            flattened = data.flatten()
-            result += "Sample values (flattened):\n"
-            for i, item in enumerate(flattened[:100]):  # Show first 100
-                if np.issubdtype(data.dtype, np.floating):
-                    result += f"[{i:4d}]  {item:.6g}\n"
-                else:
-                    result += f"[{i:4d}]  {item}\n"
+            flattened = data.ravel()
+            parts.append("Sample values (flattened):\n")
+            for i, item in enumerate(DataFormatter._format_numeric_cells(flattened[:100], is_float).tolist()):  # Show first 100
+                parts.append(f"[{i:4d}]  {item}\n")
             
             if len(flattened) > 100:
-                result += f"... (showing first 100 of {len(flattened)} total elements)"
+                parts.append(f"... (showing first 100 of {len(flattened)} total elements)")
             
-            return result
+            return "".join(parts)
+    
+    @staticmethod
+    def _format_generic_items(items: np.ndarray, max_display_width: int) -> str:
+        """Convert, truncate and index a 1D run of items with vectorized string ops"""
+        items = _to_str(items).astype(str)
+        too_long = np.char.str_len(items) > max_display_width
+        if too_long.any():
+            shortened = np.char.add(items.astype(f'<U{max(max_display_width - 3, 1)}'), "...")
+            items = np.where(too_long, shortened, items)
+        lines = np.char.add(np.char.mod("[%4d]  ", np.arange(len(items))), items)
+        return "\n".join(lines.tolist()) + "\n"
     
     @staticmethod
     def _format_generic_data(data: np.ndarray, is_truncated: bool, original_shape: Tuple, 
-                           max_display_width: int) -> str:
+                           max_display_width: int, total_size: Optional[int]) -> str:
         """Format generic data types for display"""
         if data.ndim == 1:
             # 1D array - display as vertical column
-            result = "Dataset Values:\n" + "-" * 50 + "\n"
-            for i, item in enumerate(data):
-                item_str = str(item)
-                if len(item_str) > max_display_width:
-                    item_str = item_str[:max_display_width-3] + "..."
-                result += f"[{i:4d}]  {item_str}\n"
+            parts = ["Dataset Values:\n" + "-" * 50 + "\n"]
+            if data.size:
+                parts.append(DataFormatter._format_generic_items(data, max_display_width))
             
             if is_truncated:
-                result += f"\n... (showing first {len(data)} of {np.prod(original_shape)} total elements)"
+                parts.append(f"\n... (showing first {len(data)} of {total_size} total elements)")
             
-            return result
+            return "".join(parts)
         
         else:
             # Multi-dimensional - show structure and some values
-            result = f"Dataset Array ({data.ndim}D):\n" + "-" * 50 + "\n"
-            result += f"Shape: {data.shape}\n"
-            result += f"Data type: {data.dtype}\n\n"
+            parts = [f"Dataset Array ({data.ndim}D):\n" + "-" * 50 + "\n"]
+            parts.append(f"Shape: {data.shape}\n")
+            parts.append(f"Data type: {data.dtype}\n\n")
             
             # Show some flattened values
-            flattened = data.flatten()
-            result += "Sample values (flattened):\n"
-            for i, item in enumerate(flattened[:50]):  # Show first 50
-                item_str = str(item)
-                if len(item_str) > max_display_width:
-                    item_str = item_str[:max_display_width-3] + "..."
-                result += f"[{i:4d}]  {item_str}\n"
+            flattened = data.ravel()
+            parts.append("Sample values (flattened):\n")
+            if flattened.size:
+                parts.append(DataFormatter._format_generic_items(flattened[:50], max_display_width))  # Show first 50
             
             if len(flattened) > 50:
-                result += f"... (showing first 50 of {len(flattened)} total elements)"
+                parts.append(f"... (showing first 50 of {len(flattened)} total elements)")
             
-            return result
+            return "".join(parts)
     
     @staticmethod
-    def format_dataset_info(info: dict) -> str:
+    def format_dataset_info(info: DatasetInfo) -> str:
         """
         Format dataset information for display
         
         Args:
-            info: Dictionary containing dataset information
+            info: DatasetInfo describing the dataset
             
         Returns:
             Formatted string with dataset information
@@ -210,29 +225,29 @@ class DataFormatter:
         lines = []
         
         # Basic information
-        lines.append(f"Path: {info['path']}")
-        lines.append(f"Shape: {info['shape']}")
-        lines.append(f"Data Type: {info['dtype']}")
-        lines.append(f"Total Elements: {info['size']:,}")
-        lines.append(f"Dimensions: {info['ndim']}")
+        lines.append(f"Path: {info.path}")
+        lines.append(f"Shape: {info.shape}")
+        lines.append(f"Data Type: {info.dtype}")
+        lines.append(f"Total Elements: {info.size:,}")
+        lines.append(f"Dimensions: {info.ndim}")
         
         # Optional information
-        if info.get('maxshape'):
-            lines.append(f"Max Shape: {info['maxshape']}")
+        if info.maxshape:
+            lines.append(f"Max Shape: {info.maxshape}")
         
-        if info.get('chunks'):
-            lines.append(f"Chunks: {info['chunks']}")
+        if info.chunks:
+            lines.append(f"Chunks: {info.chunks}")
         
-        if info.get('compression'):
-            lines.append(f"Compression: {info['compression']}")
+        if info.compression:
+            lines.append(f"Compression: {info.compression}")
         
-        if info.get('fillvalue') is not None:
-            lines.append(f"Fill Value: {info['fillvalue']}")
+        if info.fillvalue is not None:
+            lines.append(f"Fill Value: {info.fillvalue}")
         
         # Attributes
-        if info.get('attributes'):
+        if info.attributes:
             lines.append("\nAttributes:")
-            for key, value in info['attributes'].items():
+            for key, value in info.attributes.items():
                 lines.append(f"  {key}: {value}")
         
         return "\n".join(lines)
\ No newline at end of file
@@ -1,8 +1,11 @@
 # core/dataframe_exporter.py
+import csv
+from functools import lru_cache
 import h5py
-import pandas as pd
 import numpy as np
-from typing import List, Optional, Callable
+from typing import List, Optional, Callable, Tuple
+
+from core.h5_file_handler import DatasetInfo, H5FileHandler
 
 # Modified export_to_csv method with print statements for terminal updates
 # Chunk size defaulted to 100000 rows
@@ -12,6 +15,10 @@ class DataFrameExporter:
                      rows: Optional[List[int]], output_csv_path: str, 
                      progress_callback: Optional[Callable[[float, str], None]] = None,
                      chunk_size: int = 100000) -> None:
+        # Imported on first export rather than at app startup
+        import pandas as pd
+
+        file_handler = H5FileHandler()
         try:
             def update_progress(pct, msg):
                 print(f"[Progress {pct:.1f}%] {msg}")
@@ -20,19 +27,16 @@ class DataFrameExporter:
 
             update_progress(5, "Initializing chunked export...")
 
-            from core.h5_file_handler import H5FileHandler
-            file_handler = H5FileHandler()
-
             update_progress(10, "Analyzing dataset structure...")
-            info = file_handler.get_dataset_info(h5_file_path, dataset_path)
+            info = file_handler.get_dataset_info(h5_file_path, dataset_path, include_columns=True)
 
             if rows:
-                row_indices = sorted(rows)
+                row_indices = np.sort(np.asarray(rows, dtype=np.int64))
                 total_rows_to_export = len(row_indices)
-                is_continuous_slice = (len(row_indices) > 1 and all(row_indices[i] + 1 == row_indices[i+1] for i in range(len(row_indices)-1)))
+                is_continuous_slice = len(row_indices) > 1 and bool(np.all(np.diff(row_indices) == 1))
             else:
-                if isinstance(info['shape'], tuple) and len(info['shape']) > 0:
-                    total_dataset_rows = info['shape'][0]
+                if isinstance(info.shape, tuple) and len(info.shape) > 0:
+                    total_dataset_rows = info.shape[0]
                 else:
                     sample_data, _ = file_handler.get_dataset_data(h5_file_path, dataset_path, max_elements=1)
                     total_dataset_rows = len(sample_data) if isinstance(sample_data, pd.DataFrame) else file_handler.read_dataset(h5_file_path, dataset_path).shape[0]
@@ -44,9 +48,10 @@ class DataFrameExporter:
             update_progress(15, f"Preparing to export {total_rows_to_export:,} rows in chunks...")
 
             update_progress(20, "Validating column selection...")
-            sample_data, _ = file_handler.get_dataset_data(h5_file_path, dataset_path, max_elements=100)
-            if isinstance(sample_data, pd.DataFrame):
-                available_columns = list(sample_data.columns)
+            # Column names come from the info already fetched above rather than
+            # from reading a sample of the data
+            available_columns = info.columns or []
+            if available_columns:
                 existing_columns = [col for col in columns if col in available_columns]
                 missing_cols = set(columns) - set(existing_columns)
                 if missing_cols:
@@ -64,23 +69,40 @@ class DataFrameExporter:
 
             update_progress(25, f"Beginning chunked export: {len(chunks)} chunks of up to {chunk_size:,} rows")
 
-            for chunk_idx, chunk in enumerate(chunks):
-                update_progress(25 + (chunk_idx / len(chunks)) * 70, f"Processing chunk {chunk_idx+1}/{len(chunks)}")
-
-                if is_continuous_slice and not rows:
-                    start, end = chunk
-                    df = file_handler.read_dataset(h5_file_path, dataset_path, slice_rows=(start, end))
-                else:
-                    start, end = min(chunk), max(chunk)
-                    df = file_handler.read_dataset(h5_file_path, dataset_path, slice_rows=(start, end+1))
-                    if isinstance(df, pd.DataFrame):
-                        df = df.iloc[[i - start for i in chunk]]
-
-                df = df[columns]
-                df.to_csv(output_csv_path, mode='w' if chunk_idx == 0 else 'a', header=(chunk_idx == 0), index=False)
-
-                rows_done = min((chunk_idx + 1) * chunk_size, total_rows_to_export)
-                print(f"Wrote chunk {chunk_idx+1}/{len(chunks)} ({rows_done:,}/{total_rows_to_export:,} rows)")
+            # Opened through the handler so the dataset gets a chunk cache sized to it
+            obj = file_handler.open_object(h5_file_path, dataset_path)
+            if isinstance(obj, h5py.Dataset):
+                # Plain datasets are streamed straight from h5py into the CSV,
+                # keeping one dataset handle and one output file open throughout
+                self._export_dataset_chunks(obj, info, columns, chunks, rows, is_continuous_slice,
+                                            output_csv_path, total_rows_to_export, chunk_size,
+                                            update_progress)
+            else:
+                # Keep one buffered output handle open for every chunk rather
+                # than reopening the file in append mode each time; the header
+                # is written with the first chunk only
+                with open(output_csv_path, 'w', newline='', buffering=1 << 20) as f_out:
+                    for chunk_idx, chunk in enumerate(chunks):
+                        update_progress(25 + (chunk_idx / len(chunks)) * 70, f"Processing chunk {chunk_idx+1}/{len(chunks)}")
+
+                        if is_continuous_slice and not rows:
+                            # Full export: chunks are (start, stop) row ranges
+                            start, stop = chunk
+                            df = file_handler.read_dataset(h5_file_path, dataset_path, slice_rows=(start, stop),
+                                                           fields=columns)
+                        else:
+                            # Row indices are sorted, so the chunk spans chunk[0]..chunk[-1]
+                            start, end = int(chunk[0]), int(chunk[-1])
+                            df = file_handler.read_dataset(h5_file_path, dataset_path, slice_rows=(start, end+1),
+                                                           fields=columns)
+                            if isinstance(df, pd.DataFrame):
+                                df = df.take(chunk - start)
+
+                        df = df[columns]
+                        df.to_csv(f_out, header=(chunk_idx == 0), index=False, lineterminator='\n')
+
+                        rows_done = min((chunk_idx + 1) * chunk_size, total_rows_to_export)
+                        print(f"Wrote chunk {chunk_idx+1}/{len(chunks)} ({rows_done:,}/{total_rows_to_export:,} rows)")
 
             update_progress(95, "Finalizing export...")
             import os
@@ -98,4 +120,102 @@ class DataFrameExporter:
             error_msg = f"Chunked export failed: {str(e)}"
             if progress_callback:
                 progress_callback(0, error_msg)
-            raise Exception(error_msg)
\ No newline at end of file
+            raise Exception(error_msg) from e
+        finally:
+            file_handler.close_all()
+
+    def _export_dataset_chunks(self, dset: h5py.Dataset, info: DatasetInfo, columns: List[str], chunks: list,
+                               rows: Optional[List[int]], is_continuous_slice: bool, output_csv_path: str,
+                               total_rows_to_export: int, chunk_size: int,
+                               update_progress: Callable[[float, str], None]) -> None:
+        """Write a plain HDF5 dataset to CSV chunk by chunk without building DataFrames"""
+        # Resolve the requested columns once: structured arrays are selected by
+        # field name, simple 2D arrays by the index behind their 'Column_i' name
+        available = list(dset.dtype.names) if dset.dtype.names else (info.columns or [])
+        column_index = {name: i for i, name in enumerate(available)}
+        columns = [col for col in columns if col in column_index]
+        if not columns:
+            raise ValueError("No valid columns for export")
+
+        # Pick the text conversion for each column once per export, not per chunk
+        converters = self._compile_column_converters(dset.dtype, tuple(columns))
+        # Compound datasets read only the selected fields from the file
+        source = dset.fields(columns) if dset.dtype.names else dset
+        # Other fixed-size datasets fill one reused buffer for every contiguous chunk
+        buffer = None
+        if is_continuous_slice and not rows and not dset.dtype.names and dset.dtype.kind != 'O':
+            buffer = np.empty((min(chunk_size, dset.shape[0]),) + dset.shape[1:], dtype=dset.dtype)
+
+        with open(output_csv_path, 'w', newline='') as f_out:
+            writer = csv.writer(f_out, lineterminator='\n')
+            writer.writerow(columns)
+
+            for chunk_idx, chunk in enumerate(chunks):
+                update_progress(25 + (chunk_idx / len(chunks)) * 70, f"Processing chunk {chunk_idx+1}/{len(chunks)}")
+
+                if is_continuous_slice and not rows:
+                    start, end = chunk
+                    if buffer is not None:
+                        block = buffer[:end - start]
+                        if end > start:
+                            dset.read_direct(block, np.s_[start:end])
+                    else:
+                        block = source[start:end]
+                else:
+                    start, end = int(chunk[0]), int(chunk[-1])
+                    block = source[start:end+1].take(chunk - start, axis=0)
+
+                writer.writerows(self._block_to_text(block, columns, column_index, converters).tolist())
+
+                rows_done = min((chunk_idx + 1) * chunk_size, total_rows_to_export)
+                print(f"Wrote chunk {chunk_idx+1}/{len(chunks)} ({rows_done:,}/{total_rows_to_export:,} rows)")
+
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _compile_column_converters(dtype: np.dtype, columns: Tuple[str, ...]) -> Tuple[Callable[[np.ndarray], np.ndarray], ...]:
+        """Build the per-column array-to-text conversions for a dataset dtype, cached per (dtype, columns)"""
+        converters = []
+        for name in columns:
+            column_dtype = dtype[name] if dtype.names else dtype
+            kind = column_dtype.kind
+            if kind == 'S':
+                converters.append(_decode_text)
+            elif kind == 'U':
+                converters.append(_unicode_text)
+            elif h5py.check_string_dtype(column_dtype) is not None:
+                # Variable-length strings come back from h5py as bytes objects
+                converters.append(_decode_object_text)
+            else:
+                converters.append(_astype_text)
+        return tuple(converters)
+
+    @staticmethod
+    def _block_to_text(block: np.ndarray, columns: List[str], column_index: dict,
+                       converters: Tuple[Callable[[np.ndarray], np.ndarray], ...]) -> np.ndarray:
+        """Convert the selected columns of a raw dataset block into a 2D array of strings"""
+        if block.dtype.names:
+            cells = [block[name] for name in columns]
+        else:
+            cells = [block[:, column_index[name]] for name in columns]
+        return np.column_stack([convert(cell) for convert, cell in zip(converters, cells)])
+
+
+def _decode_text(cell: np.ndarray) -> np.ndarray:
+    """Decode a fixed-width byte string column"""
+    return np.char.decode(cell, 'utf-8', errors='replace')
+
+
+def _decode_object_text(cell: np.ndarray) -> np.ndarray:
+    """Decode a variable-length string column holding bytes (or str) objects"""
+    return np.array([item.decode('utf-8', errors='replace') if isinstance(item, bytes) else str(item)
+                     for item in cell.ravel()], dtype=str).reshape(cell.shape)
+
+
+def _unicode_text(cell: np.ndarray) -> np.ndarray:
+    """Unicode columns are already text"""
+    return cell
+
+
+def _astype_text(cell: np.ndarray) -> np.ndarray:
+    """Convert a numeric (or other) column to its string representation"""
+    return cell.astype(str)
@@ -1,8 +1,98 @@
 # core/h5_file_handler.py
+import hashlib
+import json
+import logging
+import os
+import re
+import sys
+import tempfile
+from collections import OrderedDict
 import h5py
 import numpy as np
-import pandas as pd
-from typing import List, Tuple, Any, Dict, Optional
+from dataclasses import dataclass, field, fields
+from typing import List, Tuple, Any, Dict, Optional, TYPE_CHECKING
+
+# pandas is imported inside the methods that build DataFrames: it is the
+# slowest import of the app and isn't needed until a dataframe group is read
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Number of files kept open at once; older handles are closed first
+MAX_OPEN_FILES = 4
+# Raw data chunk cache for each open file
+CHUNK_CACHE_BYTES = 128 * 1024 * 1024
+CHUNK_CACHE_SLOTS = 521
+# Upper bound for the chunk cache of a single dataset sized by open_object
+MAX_DATASET_CHUNK_CACHE_BYTES = 1024 * 1024 * 1024
+# Fixed metadata cache for each open file (the HDF5 maximum), so object
+# headers and B-tree nodes read during traversal stay cached
+METADATA_CACHE_BYTES = 128 * 1024 * 1024
+
+# Format signature at the start of every HDF5 superblock
+HDF5_SIGNATURE = b'\x89HDF\r\n\x1a\n'
+
+# Metadata saved per file in the user's cache directory, reused until the
+# file changes; H5CRUNCHER_CACHE_DIR overrides the location and setting it
+# to an empty string turns the cache off
+SIDECAR_SUFFIX = '.h5cruncher-cache'
+SIDECAR_VERSION = 1
+
+# NumPy dtype kinds treated as string and numeric data
+STRING_KINDS = frozenset('SUO')
+NUMERIC_KINDS = frozenset('iufbc')
+
+# pandas HDFStore block item names ('block0_items', ...), capturing the block number
+BLOCK_ITEMS_RE = re.compile(r'^block(\d+)_items$')
+# Matches '<group>/blockN_items' object paths, capturing the group path
+_BLOCK_ITEMS_PATH_RE = re.compile(r'^(.+)/block\d+_items$')
+
+# Errors h5py/pandas raise for unreadable files and objects; anything else propagates untouched
+H5_ERRORS = (OSError, ValueError, KeyError, TypeError)
+
+
+def _sidecar_dir() -> Optional[str]:
+    """Directory holding the metadata sidecars, or None if they are disabled"""
+    override = os.environ.get('H5CRUNCHER_CACHE_DIR')
+    if override is not None:
+        return override or None
+    if sys.platform == 'win32':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+    elif sys.platform == 'darwin':
+        base = os.path.expanduser('~/Library/Caches')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return os.path.join(base, 'h5_cruncher')
+
+
+def _with_context(error: Exception, message: str) -> Exception:
+    """Copy of error (same type where its constructor allows) with message prepended"""
+    try:
+        return type(error)(f"{message}: {error}")
+    except TypeError:
+        return Exception(f"{message}: {error}")
+
+
+@dataclass(slots=True)
+class DatasetInfo:
+    """Metadata for a dataset or a group that represents a dataframe"""
+    path: str
+    shape: Any = 'N/A'
+    dtype: Any = 'N/A'
+    size: Any = 'N/A'
+    ndim: Any = 'N/A'
+    maxshape: Any = 'N/A'
+    chunks: Any = 'N/A'
+    compression: Any = 'N/A'
+    fillvalue: Any = 'N/A'
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    columns: Optional[List[str]] = field(default_factory=list)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the fields as a plain dictionary"""
+        return {f.name: getattr(self, f.name) for f in fields(self)}
 
 
 class H5FileHandler:
@@ -10,6 +100,199 @@ class H5FileHandler:
 
     def __init__(self):
         self.current_file_path = None
+        # Open read-only handles keyed by path (least recently used first),
+        # alongside the mtime they were opened at
+        self._files: OrderedDict[str, Tuple[float, h5py.File]] = OrderedDict()
+        # get_dataset_info results keyed by (file_path, dataset_path, include_columns)
+        self._info_cache: Dict[Tuple[str, str, bool], DatasetInfo] = {}
+        # get_dataframe_columns results keyed by (file_path, mtime_ns, group_path)
+        self._columns_cache: Dict[Tuple[str, int, str], Tuple[str, ...]] = {}
+        # _probe_kinds results keyed by (file_path, mtime_ns, dataset_path)
+        self._kinds_cache: Dict[Tuple[str, int, str], frozenset] = {}
+        # Sidecars loaded so far keyed by file_path, and the ones with unsaved changes
+        self._sidecars: Dict[str, Dict[str, Any]] = {}
+        self._dirty_sidecars: set = set()
+
+    def _get_file(self, file_path: str) -> h5py.File:
+        """
+        Return a read-only handle for the file, reusing the cached one
+        unless the file has been modified since it was opened
+
+        Args:
+            file_path: Path to the HDF5 file
+
+        Returns:
+            Open h5py.File handle
+        """
+        mtime = os.stat(file_path).st_mtime
+        cached = self._files.get(file_path)
+        if cached is not None:
+            cached_mtime, handle = cached
+            if cached_mtime == mtime and handle.id.valid:
+                self._files.move_to_end(file_path)
+                return handle
+            # Stale handle - drop it along with anything derived from it
+            self._drop_file(file_path)
+
+        handle = self._open(file_path)
+        self._files[file_path] = (mtime, handle)
+        while len(self._files) > MAX_OPEN_FILES:
+            self._drop_file(next(iter(self._files)))
+        return handle
+
+    @staticmethod
+    def _open(file_path: str) -> h5py.File:
+        """Open a file read-only with enlarged chunk and metadata caches"""
+        fapl = h5py.h5p.create(h5py.h5p.FILE_ACCESS)
+        fapl.set_cache(0, CHUNK_CACHE_SLOTS, CHUNK_CACHE_BYTES, 0.75)
+
+        # Start the metadata cache at its full size and keep it there
+        mdc_config = fapl.get_mdc_config()
+        mdc_config.set_initial_size = True
+        mdc_config.initial_size = METADATA_CACHE_BYTES
+        mdc_config.min_size = METADATA_CACHE_BYTES
+        mdc_config.max_size = METADATA_CACHE_BYTES
+        mdc_config.incr_mode = 0        # H5C_incr__off
+        mdc_config.flash_incr_mode = 0  # H5C_flash_incr__off
+        mdc_config.decr_mode = 0        # H5C_decr__off
+        mdc_config.evictions_enabled = True
+        fapl.set_mdc_config(mdc_config)
+
+        return h5py.File(h5py.h5f.open(os.fsencode(file_path), h5py.h5f.ACC_RDONLY, fapl=fapl))
+
+    def open_object(self, file_path: str, dataset_path: str) -> Any:
+        """
+        Open a dataset or group for repeated reads. Chunked datasets whose
+        working set outgrows the file-wide chunk cache (eight chunks, or the
+        row of chunks one full-width slab along the first axis touches) are
+        opened with their own cache of that size, so sequential slabs don't
+        decompress the same chunks twice.
+
+        Args:
+            file_path: Path to the HDF5 file
+            dataset_path: Path to the dataset or group within the file
+
+        Returns:
+            The h5py.Dataset or h5py.Group
+        """
+        f = self._get_file(file_path)
+        obj = f[dataset_path]
+        if not isinstance(obj, h5py.Dataset) or obj.chunks is None:
+            return obj
+
+        chunk_bytes = obj.dtype.itemsize * int(np.prod(obj.chunks))
+        chunks_per_row = int(np.prod([-(-n // c) for n, c in zip(obj.shape[1:], obj.chunks[1:])]))
+        nbytes = min(max(8, chunks_per_row) * chunk_bytes, MAX_DATASET_CHUNK_CACHE_BYTES)
+        if nbytes <= CHUNK_CACHE_BYTES:
+            return obj
+
+        # HDF5 shares a dataset that is still open and ignores the access
+        # properties of later opens, so close this handle before reopening
+        name = obj.name.encode('utf-8')
+        obj.id.close()
+        dapl = h5py.h5p.create(h5py.h5p.DATASET_ACCESS)
+        # HDF5 suggests around ten hash slots per cached chunk; an odd count spreads them better
+        dapl.set_chunk_cache(max(CHUNK_CACHE_SLOTS, 10 * (nbytes // chunk_bytes) | 1), nbytes, 0.75)
+        return h5py.Dataset(h5py.h5d.open(f.id, name, dapl))
+
+    def _drop_file(self, file_path: str) -> None:
+        """Close a cached handle and forget the info derived from it"""
+        _, handle = self._files.pop(file_path)
+        handle.close()
+        self._flush_sidecar(file_path)
+        self._sidecars.pop(file_path, None)
+        self._info_cache = {key: value for key, value in self._info_cache.items()
+                            if key[0] != file_path}
+        self._columns_cache = {key: value for key, value in self._columns_cache.items()
+                               if key[0] != file_path}
+        self._kinds_cache = {key: value for key, value in self._kinds_cache.items()
+                             if key[0] != file_path}
+
+    @staticmethod
+    def _sidecar_key(file_path: str) -> List[int]:
+        """Identify the file's current contents by size and modification time"""
+        stat = os.stat(file_path)
+        return [stat.st_size, stat.st_mtime_ns]
+
+    @staticmethod
+    def _sidecar_path(file_path: str) -> Optional[str]:
+        """Cache file holding the sidecar of a data file, named after its absolute path"""
+        directory = _sidecar_dir()
+        if directory is None:
+            return None
+        digest = hashlib.sha1(os.path.abspath(file_path).encode('utf-8', 'surrogateescape')).hexdigest()
+        return os.path.join(directory, digest + SIDECAR_SUFFIX)
+
+    def _load_sidecar(self, file_path: str) -> Dict[str, Any]:
+        """
+        Return the metadata saved for the file, loading it from the cache
+        directory on first use. Returns a fresh (empty) sidecar if there is
+        none or the file has changed since; callers fill it in place and
+        call _mark_sidecar_dirty.
+        """
+        key = self._sidecar_key(file_path)
+        sidecar = self._sidecars.get(file_path)
+        if sidecar is not None and sidecar['key'] == key:
+            return sidecar
+
+        # Changes recorded against an older version of the file are stale
+        self._dirty_sidecars.discard(file_path)
+        sidecar = {'version': SIDECAR_VERSION, 'key': key}
+        sidecar_path = self._sidecar_path(file_path)
+        if sidecar_path is not None:
+            try:
+                with open(sidecar_path, 'r', encoding='utf-8') as f:
+                    saved = json.load(f)
+                if saved.get('version') == SIDECAR_VERSION and saved.get('key') == key:
+                    sidecar = saved
+            except (OSError, ValueError, AttributeError):
+                pass
+        self._sidecars[file_path] = sidecar
+        return sidecar
+
+    def _mark_sidecar_dirty(self, file_path: str) -> None:
+        """Schedule the file's in-memory sidecar to be written on the next flush"""
+        self._dirty_sidecars.add(file_path)
+
+    def _flush_sidecar(self, file_path: str) -> None:
+        """Atomically write the file's sidecar if it has unsaved changes; failures are ignored"""
+        if file_path not in self._dirty_sidecars:
+            return
+        self._dirty_sidecars.discard(file_path)
+        sidecar = self._sidecars.get(file_path)
+        sidecar_path = self._sidecar_path(file_path)
+        if sidecar is None or sidecar_path is None:
+            return
+        tmp_path = None
+        try:
+            os.makedirs(os.path.dirname(sidecar_path), exist_ok=True)
+            with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=os.path.dirname(sidecar_path),
+                                             suffix='.tmp', delete=False) as f:
+                tmp_path = f.name
+                json.dump(sidecar, f)
+            os.replace(tmp_path, sidecar_path)
+        except (OSError, TypeError, ValueError):
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+
+    def flush_sidecars(self) -> None:
+        """Save pending sidecar changes; callers scanning many groups call this once when done"""
+        for file_path in list(self._dirty_sidecars):
+            self._flush_sidecar(file_path)
+
+    def close_all(self) -> None:
+        """Close all cached file handles and save any pending sidecar changes"""
+        for _, handle in self._files.values():
+            handle.close()
+        self.flush_sidecars()
+        self._sidecars.clear()
+        self._files.clear()
+        self._info_cache.clear()
+        self._columns_cache.clear()
+        self._kinds_cache.clear()
 
     def validate_file(self, file_path: str) -> bool:
         """
@@ -22,13 +305,30 @@ class H5FileHandler:
             bool: True if valid, False otherwise
         """
         try:
-            with h5py.File(file_path, 'r') as f:
-                # Just try to open it - if it works, it's valid
-                pass
-            return True
+            # Reject anything without an HDF5 signature before involving the library
+            if not self._has_hdf5_signature(file_path):
+                return False
+            # Let HDF5 confirm the superblock without building a File object
+            return bool(h5py.is_hdf5(file_path))
         except (OSError, ValueError):
             return False
 
+    @staticmethod
+    def _has_hdf5_signature(file_path: str) -> bool:
+        """
+        Check for the 8-byte HDF5 format signature. The superblock sits at
+        offset 0, or after a user block at 512, 1024, 2048, ... bytes.
+        """
+        with open(file_path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            offset = 0
+            while offset + len(HDF5_SIGNATURE) <= size:
+                f.seek(offset)
+                if f.read(len(HDF5_SIGNATURE)) == HDF5_SIGNATURE:
+                    return True
+                offset = offset * 2 if offset else 512
+        return False
+
     def get_datasets(self, file_path: str) -> List[str]:
         """
         Extract all dataset paths from an HDF5 file
@@ -42,122 +342,153 @@ class H5FileHandler:
         Raises:
             Exception: If file cannot be read
         """
-        datasets = []
+        sidecar = self._load_sidecar(file_path)
+        if 'datasets' in sidecar:
+            self.current_file_path = file_path
+            return list(sidecar['datasets'])
 
-        def visit_func(name, obj):
-            if isinstance(obj, h5py.Dataset):
-                datasets.append(name)
-            # Also consider groups that might represent dataframes
-            # A common pattern for pandas HDFStore DataFrames is a group containing 'block*_items'
-            elif isinstance(obj, h5py.Group) and any(key.startswith('block') and key.endswith('_items') for key in obj.keys()):
-                datasets.append(name)
+        dataset_names = []
+        dataset_type = h5py.h5o.TYPE_DATASET
 
+        def visit_func(name, obj_info):
+            # Low-level visit: only the object type is inspected, no Python
+            # Dataset/Group wrappers are built. Keep the callback minimal and
+            # post-process the collected names afterwards.
+            if obj_info.type == dataset_type:
+                dataset_names.append(name)
 
         try:
-            with h5py.File(file_path, 'r') as f:
-                f.visititems(visit_func)
-            self.current_file_path = file_path
-            return sorted(list(set(datasets))) # Return unique and sorted paths
-        except Exception as e:
-            raise Exception(f"Failed to read HDF5 file: {str(e)}")
+            f = self._get_file(file_path)
+            h5py.h5o.visit(f.id, visit_func, info=True)
 
-    def get_dataset_info(self, file_path: str, dataset_path: str) -> Dict[str, Any]:
+            datasets = [name.decode('utf-8') for name in dataset_names]
+            # Also consider groups that might represent dataframes
+            # A common pattern for pandas HDFStore DataFrames is a group containing 'block*_items'
+            # (a set, since one group holds several blockN_items)
+            datasets.extend({match.group(1) for match in map(_BLOCK_ITEMS_PATH_RE.match, datasets) if match})
+            self.current_file_path = file_path
+            # Visiting reports each object once, so only a sort is needed
+            datasets.sort()
+            sidecar['datasets'] = datasets
+            self._mark_sidecar_dirty(file_path)
+            self._flush_sidecar(file_path)
+            return list(datasets)
+        except H5_ERRORS as e:
+            raise _with_context(e, "Failed to read HDF5 file") from e
+
+    def get_dataset_info(self, file_path: str, dataset_path: str, *, include_columns: bool = False) -> DatasetInfo:
         """
         Get detailed information about a specific dataset or group that represents a dataframe.
 
         Args:
             file_path: Path to the HDF5 file
             dataset_path: Path to the dataset or group within the file
+            include_columns: Read the column names of dataframe groups. When False,
+                             groups get columns=None and their shape is taken from
+                             metadata only, which is enough for list/tree rendering.
 
         Returns:
-            Dictionary with dataset information
-        """
-        info = {
-            'path': dataset_path,
-            'shape': 'N/A',
-            'dtype': 'N/A',
-            'size': 'N/A',
-            'ndim': 'N/A',
-            'maxshape': 'N/A',
-            'chunks': 'N/A',
-            'compression': 'N/A',
-            'fillvalue': 'N/A',
-            'attributes': {},
-            'columns': [] # Add a key for columns
-        }
+            DatasetInfo with dataset information
+        """
+        info = DatasetInfo(path=dataset_path)
         try:
-            with h5py.File(file_path, 'r') as f:
-                if dataset_path not in f:
-                    raise ValueError(f"Object '{dataset_path}' not found in HDF5 file.")
-
-                obj = f[dataset_path]
-
-                if isinstance(obj, h5py.Dataset):
-                    info['shape'] = obj.shape
-                    info['dtype'] = str(obj.dtype)
-                    info['size'] = obj.size
-                    info['ndim'] = obj.ndim
-                    info['maxshape'] = obj.maxshape
-                    info['chunks'] = obj.chunks
-                    info['compression'] = obj.compression
-                    info['fillvalue'] = obj.fillvalue
-                    # Add attributes
-                    for key, value in obj.attrs.items():
-                        info['attributes'][key] = value
-
-                    # For single dataset, if it looks like a DataFrame, try to get columns
-                    if info['ndim'] == 2 and (obj.dtype.fields is None): # Simple 2D array
-                        info['columns'] = [f'Column_{i}' for i in range(info['shape'][1])]
-                    elif obj.dtype.fields is not None: # Structured array
-                         info['columns'] = list(obj.dtype.fields.keys())
-
-                elif isinstance(obj, h5py.Group):
-                    # This is where we try to infer if it's a pandas HDFStore dataframe
-                    # or a similar tabular structure.
-                    info['shape'] = 'Inferred'
-                    info['dtype'] = 'Mixed/Inferred'
-                    info['size'] = 'Inferred'
-                    info['ndim'] = 'Inferred'
-
-                    # Try to get columns for pandas HDFStore like groups
-                    columns = self.get_dataframe_columns(file_path, dataset_path)
-                    info['columns'] = columns
-
-                    # Try to infer shape from block_values
-                    inferred_rows = 0
-                    inferred_cols = len(columns) if columns else 0
-
-                    # Attempt to find shape from a block_values dataset
-                    for key in obj.keys():
-                        if key.startswith('block') and key.endswith('_values') and isinstance(obj[key], h5py.Dataset):
-                            if len(obj[key].shape) > 0:
-                                inferred_rows = max(inferred_rows, obj[key].shape[0])
-                            # If it's a 1D block, its length is its "column"
-                            if len(obj[key].shape) == 1 and inferred_cols == 0 and columns:
-                                inferred_cols = len(columns)
-
-                    if inferred_rows > 0:
-                        # If a group represents a table, its first dimension is rows, second is columns
-                        if inferred_cols > 0:
-                            info['shape'] = (inferred_rows, inferred_cols)
-                            info['size'] = inferred_rows * inferred_cols
-                            info['ndim'] = 2 # Assuming 2D for tabular data
-                        else: # Single column inferred or cannot determine columns
-                            info['shape'] = (inferred_rows,)
-                            info['size'] = inferred_rows
-                            info['ndim'] = 1
-
-
-                    # Add attributes for the group
-                    for key, value in obj.attrs.items():
-                        info['attributes'][key] = value
+            f = self._get_file(file_path)
+            # Full info (with columns) also satisfies a shallow request
+            cached = self._info_cache.get((file_path, dataset_path, True))
+            if cached is None and not include_columns:
+                cached = self._info_cache.get((file_path, dataset_path, False))
+            if cached is not None:
+                return cached
+
+            if dataset_path not in f:
+                raise ValueError(f"Object '{dataset_path}' not found in HDF5 file.")
 
+            obj = f[dataset_path]
+
+            if isinstance(obj, h5py.Dataset):
+                info.shape = obj.shape
+                info.dtype = str(obj.dtype)
+                info.size = obj.size
+                info.ndim = obj.ndim
+                info.maxshape = obj.maxshape
+                info.chunks = obj.chunks
+                info.compression = obj.compression
+                info.fillvalue = obj.fillvalue
+                # Add attributes
+                for key, value in obj.attrs.items():
+                    info.attributes[key] = value
+
+                # For single dataset, if it looks like a DataFrame, try to get columns
+                if info.ndim == 2 and (obj.dtype.fields is None): # Simple 2D array
+                    info.columns = [f'Column_{i}' for i in range(info.shape[1])]
+                elif obj.dtype.fields is not None: # Structured array
+                     info.columns = list(obj.dtype.names)
+
+            elif isinstance(obj, h5py.Group):
+                # This is where we try to infer if it's a pandas HDFStore dataframe
+                # or a similar tabular structure.
+                info.shape = 'Inferred'
+                info.dtype = 'Mixed/Inferred'
+                info.size = 'Inferred'
+                info.ndim = 'Inferred'
+
+                if include_columns:
+                    # Try to get columns for pandas HDFStore like groups. A
+                    # single lookup is its own batch, so newly inferred columns
+                    # are saved right away.
+                    columns = self.get_dataframe_columns(file_path, dataset_path)
+                    info.columns = columns
+                    self.flush_sidecars()
                 else:
-                    raise ValueError(f"Object '{dataset_path}' not found in HDF5 file.")
-        except Exception as e:
-            raise Exception(f"Failed to get dataset info for {dataset_path}: {str(e)}")
+                    # Count the columns from the stored name arrays' shapes without reading them
+                    columns = None
+                    info.columns = None
+
+                # Try to infer shape from block_values
+                inferred_rows = 0
+                inferred_cols = len(columns) if columns else (0 if include_columns else self._count_columns(obj))
+
+                # Attempt to find shape from a block_values dataset
+                for key in obj.keys():
+                    if key.startswith('block') and key.endswith('_values') and isinstance(obj[key], h5py.Dataset):
+                        if len(obj[key].shape) > 0:
+                            inferred_rows = max(inferred_rows, obj[key].shape[0])
+                        # If it's a 1D block, its length is its "column"
+                        if len(obj[key].shape) == 1 and inferred_cols == 0 and columns:
+                            inferred_cols = len(columns)
+
+                if inferred_rows > 0:
+                    # If a group represents a table, its first dimension is rows, second is columns
+                    if inferred_cols > 0:
+                        info.shape = (inferred_rows, inferred_cols)
+                        info.size = inferred_rows * inferred_cols
+                        info.ndim = 2 # Assuming 2D for tabular data
+                    else: # Single column inferred or cannot determine columns
+                        info.shape = (inferred_rows,)
+                        info.size = inferred_rows
+                        info.ndim = 1
+
+
+                # Add attributes for the group
+                for key, value in obj.attrs.items():
+                    info.attributes[key] = value
+
+            else:
+                raise ValueError(f"Object '{dataset_path}' not found in HDF5 file.")
+        except H5_ERRORS as e:
+            raise _with_context(e, f"Failed to get dataset info for {dataset_path}") from e
+        self._info_cache[(file_path, dataset_path, include_columns)] = info
         return info
 
+    @staticmethod
+    def _count_columns(group: h5py.Group) -> int:
+        """Number of columns of a pandas HDFStore group, from dataset shapes only"""
+        axis0 = group.get('axis0')
+        if isinstance(axis0, h5py.Dataset) and axis0.ndim == 1:
+            return axis0.shape[0]
+        return sum(group[key].shape[0] for key in group.keys()
+                   if BLOCK_ITEMS_RE.match(key) and isinstance(group[key], h5py.Dataset) and group[key].ndim == 1)
+
     def get_dataframe_columns(self, file_path: str, group_path: str) -> List[str]:
         """
         Attempts to infer DataFrame-like columns from an HDF5 group,
@@ -171,69 +502,98 @@ class H5FileHandler:
         Returns:
             List[str]: List of inferred column names.
         """
+        try:
+            mtime_ns = os.stat(file_path).st_mtime_ns
+        except OSError as e:
+            logger.error("Error inferring dataframe columns for %s: %s", group_path, e, exc_info=True)
+            return []
+        key = (file_path, mtime_ns, group_path)
+        columns = self._columns_cache.get(key)
+        if columns is None:
+            columns = self._columns_cache[key] = self._get_dataframe_columns_uncached(file_path, group_path)
+        return list(columns)
+
+    def _get_dataframe_columns_uncached(self, file_path: str, group_path: str) -> Tuple[str, ...]:
+        """Column lookup behind get_dataframe_columns, from the sidecar or the file itself"""
+        sidecar = self._load_sidecar(file_path)
+        cached = sidecar.get('columns', {}).get(group_path)
+        if cached is not None:
+            return tuple(cached)
+
+        columns = self._infer_dataframe_columns(file_path, group_path)
+        # Saved by flush_sidecars (or when the file is closed), so a scan
+        # over many groups writes the sidecar once
+        sidecar.setdefault('columns', {})[group_path] = list(columns)
+        self._mark_sidecar_dirty(file_path)
+        return columns
+
+    def _infer_dataframe_columns(self, file_path: str, group_path: str) -> Tuple[str, ...]:
+        """Column inference from the group's axis0 / block*_items datasets"""
         columns = []
         try:
-            with h5py.File(file_path, 'r') as hf:
-                if group_path not in hf or not isinstance(hf[group_path], h5py.Group):
-                    return [] # Not a group or doesn't exist
+            hf = self._get_file(file_path)
+            if group_path not in hf or not isinstance(hf[group_path], h5py.Group):
+                return () # Not a group or doesn't exist
+
+            group = hf[group_path]
+
+            # 1. Try to read from 'axis0' if it exists and contains string data
+            if 'axis0' in group and isinstance(group['axis0'], h5py.Dataset):
+                try:
+                    # Decode byte strings if necessary
+                    columns.extend(self._decode_names(group['axis0'][()]))
+
+                    if columns:
+                        return tuple(columns) # Found columns from axis0
+
+                except Exception as e:
+                    logger.warning("Could not read 'axis0' for columns in %s: %s", group_path, e, exc_info=True)
+
+            # 2. If 'axis0' didn't provide columns, look for 'blockX_items'
+            block_items = []
+            matches = [match for match in map(BLOCK_ITEMS_RE.match, group.keys()) if match]
+            # Sort by block number to ensure consistent order (block0, block1, ..., block10)
+            for key in [match.group(0) for match in sorted(matches, key=lambda m: int(m.group(1)))]:
+                if isinstance(group[key], h5py.Dataset):
+                    try:
+                        block_items.append(np.atleast_1d(group[key][()]))
+                    except Exception as e:
+                        logger.warning("Could not read block_items '%s' for columns in %s: %s", key, group_path, e, exc_info=True)
 
-                group = hf[group_path]
+            # Decode all blocks in one pass when they share a string kind
+            block_item_columns = []
+            try:
+                if len({items.dtype.kind for items in block_items}) == 1:
+                    block_item_columns = self._decode_names(np.concatenate(block_items))
+                else:
+                    block_item_columns = [name for items in block_items for name in self._decode_names(items)]
+            except Exception as e:
+                logger.warning("Could not decode block_items for columns in %s: %s", group_path, e, exc_info=True)
 
-                # 1. Try to read from 'axis0' if it exists and contains string data
-                if 'axis0' in group and isinstance(group['axis0'], h5py.Dataset):
-                    try:
-                        # Decode byte strings if necessary
-                        temp_cols = group['axis0'][()]
-                        if temp_cols.dtype.kind == 'S': # Byte string
-                            columns.extend([s.decode('utf-8') for s in temp_cols])
-                        elif temp_cols.dtype.kind == 'U': # Unicode string
-                            columns.extend(temp_cols)
-                        elif temp_cols.dtype.kind == 'O' and isinstance(temp_cols, np.ndarray): # Object array
-                            # Try to convert object array to string
-                            for item in temp_cols:
-                                if isinstance(item, bytes):
-                                    columns.append(item.decode('utf-8'))
-                                else:
-                                    columns.append(str(item))
-
-                        if columns:
-                            return columns # Found columns from axis0
+            if block_item_columns:
+                return tuple(block_item_columns) # Return columns found from block_items
 
-                    except Exception as e:
-                        print(f"Warning: Could not read 'axis0' for columns in {group_path}: {e}")
-
-                # 2. If 'axis0' didn't provide columns, look for 'blockX_items'
-                block_item_columns = []
-                for key in sorted(group.keys()): # Sort to ensure consistent order (block0, block1, etc.)
-                    if key.startswith('block') and key.endswith('_items') and isinstance(group[key], h5py.Dataset):
-                        try:
-                            items_data = group[key][()]
-                            if items_data.dtype.kind == 'S': # Byte string
-                                block_item_columns.extend([s.decode('utf-8') for s in items_data])
-                            elif items_data.dtype.kind == 'U': # Unicode string
-                                block_item_columns.extend(items_data)
-                            elif items_data.dtype.kind == 'O' and isinstance(items_data, np.ndarray): # Object array
-                                for item in items_data:
-                                    if isinstance(item, bytes):
-                                        block_item_columns.append(item.decode('utf-8'))
-                                    else:
-                                        block_item_columns.append(str(item))
-
-                        except Exception as e:
-                            print(f"Warning: Could not read block_items '{key}' for columns in {group_path}: {e}")
-
-                if block_item_columns:
-                    return block_item_columns # Return columns found from block_items
-
-                # 3. If it's a dataset and structured, get column names from dtype.fields
-                if isinstance(group, h5py.Dataset) and group.dtype.fields is not None:
-                    return list(group.dtype.fields.keys())
+            # 3. If it's a dataset and structured, get column names from dtype.fields
+            if isinstance(group, h5py.Dataset) and group.dtype.fields is not None:
+                return tuple(group.dtype.fields.keys())
 
         except Exception as e:
-            print(f"Error inferring dataframe columns for {group_path}: {e}")
+            logger.error("Error inferring dataframe columns for %s: %s", group_path, e, exc_info=True)
+        return ()
+
+    @staticmethod
+    def _decode_names(names: np.ndarray) -> List[str]:
+        """Convert an array of stored names (bytes, unicode or objects) to a list of str"""
+        if names.dtype.kind == 'S': # Byte string - decode in one vectorized call
+            return np.char.decode(names, 'utf-8').tolist()
+        elif names.dtype.kind == 'U': # Unicode string
+            return names.tolist()
+        elif names.dtype.kind == 'O': # Object array
+            return [item.decode('utf-8') if isinstance(item, bytes) else str(item) for item in names]
         return []
 
-    def read_dataset(self, file_path: str, dataset_path: str, slice_rows: Optional[Tuple[int, int]] = None) -> Any:
+    def read_dataset(self, file_path: str, dataset_path: str, slice_rows: Optional[Tuple[int, int]] = None,
+                     fields: Optional[List[str]] = None) -> Any:
         """
         Reads a full dataset or a slice of it.
         This method will also attempt to reconstruct a pandas DataFrame if the
@@ -244,42 +604,126 @@ class H5FileHandler:
             dataset_path (str): Path to the dataset or group within the file.
             slice_rows (Optional[Tuple[int, int]]): A tuple (start_row, end_row)
                                                      for slicing. If None, read all.
+            fields (Optional[List[str]]): Columns to return. Compound datasets read
+                                          only these fields from the file and
+                                          dataframe groups only the blocks holding
+                                          them. Ignored for other datasets.
 
         Returns:
             Any: The dataset data, potentially as a pandas DataFrame.
         """
         try:
-            with h5py.File(file_path, 'r') as hf:
-                if dataset_path not in hf:
-                    raise ValueError(f"Object '{dataset_path}' not found in file.")
+            hf = self._get_file(file_path)
+            if dataset_path not in hf:
+                raise ValueError(f"Object '{dataset_path}' not found in file.")
 
-                obj = hf[dataset_path]
+            obj = hf[dataset_path]
 
-                if isinstance(obj, h5py.Dataset):
-                    # For a direct dataset, read it as is
-                    if slice_rows:
-                        start, end = slice_rows
-                        return obj[start:end]
-                    else:
-                        return obj[:]
-                elif isinstance(obj, h5py.Group):
-                    # This might be a pandas HDFStore DataFrame
-                    # Attempt to reconstruct a DataFrame using pandas' own read_hdf
-                    try:
-                        df = pd.read_hdf(file_path, key=dataset_path, start=slice_rows[0] if slice_rows else None,
-                                         stop=slice_rows[1] if slice_rows else None)
-                        return df
-                    except Exception as e:
-                        # Fallback if pandas.read_hdf fails for some reason
-                        print(f"Warning: Could not read group '{dataset_path}' directly as pandas HDF: {e}")
-                        # If direct read_hdf fails, try to assemble from blocks.
-                        # This part is more complex and depends heavily on pandas' internal HDFStore format.
-                        # For now, if read_hdf fails, it implies a non-standard or complex HDFStore group.
-                        raise ValueError(f"Group '{dataset_path}' is a complex HDF5 structure; direct DataFrame reconstruction failed.")
+            if isinstance(obj, h5py.Dataset):
+                # Let HDF5 skip the bytes of unselected compound fields
+                if fields and obj.dtype.names:
+                    obj = obj.fields(list(fields))
+                # For a direct dataset, read it as is
+                if slice_rows:
+                    start, end = slice_rows
+                    return obj[start:end]
                 else:
-                    raise TypeError(f"Object at '{dataset_path}' is neither a Dataset nor a Group.")
-        except Exception as e:
-            raise Exception(f"Failed to read dataset/group data from {dataset_path}: {str(e)}")
+                    return obj[:]
+            elif isinstance(obj, h5py.Group):
+                # This might be a pandas HDFStore DataFrame. Simple numeric
+                # 'fixed' frames are assembled straight from their blocks.
+                df = self._read_fixed_frame(obj, slice_rows, fields)
+                if df is not None:
+                    return df
+
+                # Otherwise reconstruct it using pandas' own read_hdf
+                import pandas as pd
+                try:
+                    df = pd.read_hdf(file_path, key=dataset_path, start=slice_rows[0] if slice_rows else None,
+                                     stop=slice_rows[1] if slice_rows else None)
+                    # Fixed stores can't select columns on read
+                    return df[list(fields)] if fields else df
+                except Exception as e:
+                    # Fallback if pandas.read_hdf fails for some reason
+                    logger.warning("Could not read group '%s' directly as pandas HDF: %s", dataset_path, e, exc_info=True)
+                    # If direct read_hdf fails, try to assemble from blocks.
+                    # This part is more complex and depends heavily on pandas' internal HDFStore format.
+                    # For now, if read_hdf fails, it implies a non-standard or complex HDFStore group.
+                    raise ValueError(f"Group '{dataset_path}' is a complex HDF5 structure; direct DataFrame reconstruction failed.") from e
+            else:
+                raise TypeError(f"Object at '{dataset_path}' is neither a Dataset nor a Group.")
+        except H5_ERRORS as e:
+            raise _with_context(e, f"Failed to read dataset/group data from {dataset_path}") from e
+
+    def _read_fixed_frame(self, group: h5py.Group, slice_rows: Optional[Tuple[int, int]],
+                          fields: Optional[List[str]] = None) -> Optional['pd.DataFrame']:
+        """
+        Build a DataFrame directly from the blocks of a pandas HDFStore 'fixed'
+        frame, skipping the PyTables round trip of pd.read_hdf.
+
+        Only plain numeric blocks with a regular integer index are handled;
+        anything else (object/string, datetime, MultiIndex, named axes)
+        returns None so the caller falls back to pandas.
+
+        Args:
+            group: The HDFStore group holding the frame
+            slice_rows: Optional (start_row, end_row) to read
+            fields: Optional columns to return; blocks holding none of them are not read
+
+        Returns:
+            The DataFrame, or None if the layout is not supported
+        """
+        import pandas as pd
+
+        attrs = group.attrs
+        if attrs.get('pandas_type') != b'frame' or 'axis0' not in group or 'axis1' not in group:
+            return None
+        axis0, axis1 = group['axis0'], group['axis1']
+        if (attrs.get('axis0_variety') != b'regular' or attrs.get('axis1_variety') != b'regular'
+                or axis1.attrs.get('kind') != b'integer'
+                or axis0.attrs.get('name') != b'N.' or axis1.attrs.get('name') != b'N.'):
+            return None
+
+        # Non-string column labels (e.g. integers) are left to pandas, which
+        # restores their original type
+        column_names = axis0[()]
+        if column_names.dtype.kind not in 'SUO':
+            return None
+        columns = self._decode_names(column_names)
+        if len(set(columns)) != len(columns):
+            return None
+        if fields:
+            wanted = set(fields)
+            if not wanted.issubset(columns):
+                return None
+            columns = list(fields)
+
+        start, stop = slice_rows if slice_rows else (None, None)
+        frames = []
+        for i in range(int(attrs.get('nblocks', 0))):
+            items = group.get(f'block{i}_items')
+            values = group.get(f'block{i}_values')
+            if not isinstance(items, h5py.Dataset) or items.dtype.kind not in 'SUO':
+                return None
+            names = self._decode_names(items[()])
+            if fields and not wanted.intersection(names):
+                continue
+            # Checked on the HDF5 type class: booleans are stored as bitfields
+            # that h5py reads back as uint8
+            if (not isinstance(values, h5py.Dataset)
+                    or attrs.get(f'block{i}_items_variety') != b'regular'
+                    or values.ndim != 2 or values.shape[1] != len(names)
+                    or values.id.get_type().get_class() not in (h5py.h5t.INTEGER, h5py.h5t.FLOAT)
+                    or 'value_type' in values.attrs or not values.attrs.get('transposed', 0)):
+                return None
+            # Transposed blocks are stored row-major as (rows, block columns)
+            frames.append(pd.DataFrame(values[start:stop], columns=names))
+
+        if not frames:
+            return None
+        df = pd.concat(frames, axis=1)[columns]
+        df.index = pd.Index(axis1[start:stop])
+        return df
 
     def get_dataset_data(self, file_path: str, dataset_path: str, max_elements: int = 1000) -> Tuple[Any, bool]:
         """
@@ -294,89 +738,168 @@ class H5FileHandler:
             Tuple: (data, is_truncated)
         """
         try:
-            with h5py.File(file_path, 'r') as f:
-                obj = f[dataset_path]
-                is_truncated = False
+            f = self._get_file(file_path)
+            obj = f[dataset_path]
+            is_truncated = False
 
-                if isinstance(obj, h5py.Dataset):
-                    # Check if the dataset is too large
-                    if obj.size > max_elements:
-                        is_truncated = True
-                        if obj.ndim == 1:
-                            return obj[:max_elements], True
-                        elif obj.ndim == 2:
-                            # For 2D, take first max_elements rows, all columns
-                            if obj.shape[0] * obj.shape[1] > max_elements: # Check total elements, not just rows
-                                return obj[:max_elements//obj.shape[1] if obj.shape[1] > 0 else 1, :], True # Take enough rows to meet max_elements
-                            else:
-                                return obj[:], False # Not truncated if fits
+            if isinstance(obj, h5py.Dataset):
+                # Check if the dataset is too large
+                if obj.size > max_elements:
+                    is_truncated = True
+                    if obj.ndim == 1:
+                        return self._read_leading_rows(obj, max_elements), True
+                    elif obj.ndim == 2:
+                        # For 2D, take first max_elements rows, all columns
+                        if obj.shape[0] * obj.shape[1] > max_elements: # Check total elements, not just rows
+                            return self._read_leading_rows(obj, max_elements//obj.shape[1] if obj.shape[1] > 0 else 1), True # Take enough rows to meet max_elements
                         else:
-                            # Multi-dimensional - flatten and take first max_elements
-                            return obj.flat[:max_elements], True
+                            return self._read_full(obj), False # Not truncated if fits
                     else:
-                        return obj[:], False
-                elif isinstance(obj, h5py.Group):
-                    # If it's a group representing a dataframe, try to read a sample using pandas
-                    try:
-                        df_sample = pd.read_hdf(file_path, key=dataset_path, stop=max_elements)
-                        if df_sample.size > max_elements: # Check actual elements in sample vs max_elements
-                            is_truncated = True
-                        return df_sample, is_truncated
-                    except Exception as e:
-                        print(f"Warning: Could not read group '{dataset_path}' as pandas HDF for sample: {e}")
-                        return f"Group: {dataset_path}. (Unable to display raw data as DataFrame.)", False
+                        # Multi-dimensional - read only the bounding box of the first
+                        # max_elements elements (in C order), then flatten and trim
+                        return obj[self._leading_box(obj.shape, max_elements)].ravel()[:max_elements], True
                 else:
-                    return "Unsupported HDF5 object type", False
-
-        except Exception as e:
-            raise Exception(f"Failed to read dataset data: {str(e)}")
+                    return self._read_full(obj), False
+            elif isinstance(obj, h5py.Group):
+                # If it's a group representing a dataframe, try to read a sample using pandas
+                import pandas as pd
+                try:
+                    df_sample = pd.read_hdf(file_path, key=dataset_path, stop=max_elements)
+                    if df_sample.size > max_elements: # Check actual elements in sample vs max_elements
+                        is_truncated = True
+                    return df_sample, is_truncated
+                except Exception as e:
+                    logger.warning("Could not read group '%s' as pandas HDF for sample: %s", dataset_path, e, exc_info=True)
+                    return f"Group: {dataset_path}. (Unable to display raw data as DataFrame.)", False
+            else:
+                return "Unsupported HDF5 object type", False
+
+        except H5_ERRORS as e:
+            raise _with_context(e, "Failed to read dataset data") from e
+
+    @staticmethod
+    def _read_leading_rows(obj: h5py.Dataset, nrows: int) -> np.ndarray:
+        """
+        Read the first nrows rows of a dataset with a single read_direct into
+        a preallocated array, avoiding h5py's intermediate selection buffers.
+        Contiguous numeric datasets are copied straight from a memory map and
+        variable-length (object) datasets fall back to plain slicing.
+        """
+        nrows = min(nrows, obj.shape[0])
+        view = H5FileHandler._contiguous_view(obj)
+        if view is not None:
+            return np.array(view[:nrows])
+        if obj.dtype.kind == 'O':
+            return obj[:nrows]
+        out = np.empty((nrows,) + obj.shape[1:], dtype=obj.dtype)
+        if nrows:
+            obj.read_direct(out, np.s_[0:nrows])
+        return out
+
+    @staticmethod
+    def _leading_box(shape: Tuple[int, ...], count: int) -> Tuple[slice, ...]:
+        """
+        Smallest hyperslab holding the first count elements of an array of the
+        given shape in C order: one index along the leading axes, as much as
+        needed of the first axis whose trailing block is smaller than count,
+        and everything after it. Only the chunks it touches are decompressed.
+        """
+        box = []
+        for axis in range(len(shape)):
+            inner = int(np.prod(shape[axis + 1:]))
+            if inner < count:
+                box.append(slice(0, -(-count // inner)))
+                box.extend(slice(None) for _ in shape[axis + 1:])
+                break
+            box.append(slice(0, 1))
+        return tuple(box)
+
+    @staticmethod
+    def _contiguous_view(obj: h5py.Dataset) -> Optional[np.memmap]:
+        """
+        Memory-map the raw bytes of a contiguous numeric dataset, bypassing the
+        HDF5 read pipeline. Returns None when the data can't be read in place:
+        chunked/compact/external/virtual layouts, unallocated storage, and
+        types whose file layout may differ from the NumPy dtype (compound,
+        string, enum, bitfield).
+        """
+        if (obj.chunks is not None or not obj.size or obj.dtype.names
+                or obj.id.get_type().get_class() not in (h5py.h5t.INTEGER, h5py.h5t.FLOAT)
+                or obj.id.get_create_plist().get_layout() != h5py.h5d.CONTIGUOUS
+                # Unwritten storage reads as the fill value, not the raw bytes
+                or obj.id.get_space_status() != h5py.h5d.SPACE_STATUS_ALLOCATED
+                or obj.id.get_storage_size() != obj.size * obj.dtype.itemsize):
+            return None
+        offset = obj.id.get_offset()
+        if offset is None:
+            return None
+        return np.memmap(obj.file.filename, mode='r', dtype=obj.dtype, shape=obj.shape, offset=offset)
+
+    @staticmethod
+    def _read_full(obj: h5py.Dataset) -> np.ndarray:
+        """
+        Read a whole dataset with a single read_direct into a preallocated array.
+        Contiguous numeric datasets are copied straight from a memory map;
+        variable-length (object) and empty datasets fall back to plain indexing.
+        """
+        view = H5FileHandler._contiguous_view(obj)
+        if view is not None:
+            return np.array(view)
+        if obj.dtype.kind == 'O' or not obj.size:
+            return obj[()]
+        out = np.empty(obj.shape, dtype=obj.dtype)
+        obj.read_direct(out)
+        return out
 
     def is_string_dataset(self, file_path: str, dataset_path: str) -> bool:
         """
         Check if a dataset contains string data.
         Handles both h5py.Dataset and h5py.Group (for DataFrames).
         """
-        try:
-            with h5py.File(file_path, 'r') as f:
-                obj = f[dataset_path]
-                if isinstance(obj, h5py.Dataset):
-                    return obj.dtype.kind in ('S', 'U', 'O')
-                elif isinstance(obj, h5py.Group):
-                    try:
-                        # Try to load a small sample as DataFrame and check dtypes
-                        df_sample = pd.read_hdf(file_path, key=dataset_path, stop=1)
-                        return any(pd.api.types.is_string_dtype(df_sample[col]) for col in df_sample.columns)
-                    except Exception as e:
-                        # Fallback for groups not directly readable by pd.read_hdf
-                        for key in obj.keys():
-                            if key.endswith('_values') and isinstance(obj[key], h5py.Dataset):
-                                if obj[key].dtype.kind in ('S', 'U', 'O'):
-                                    return True
-                    return False
-        except Exception:
-            return False
+        return bool(self._probe_kinds(file_path, dataset_path) & STRING_KINDS)
 
     def is_numeric_dataset(self, file_path: str, dataset_path: str) -> bool:
         """
         Check if a dataset contains numeric data.
         Handles both h5py.Dataset and h5py.Group (for DataFrames).
         """
+        return bool(self._probe_kinds(file_path, dataset_path) & NUMERIC_KINDS)
+
+    def _probe_kinds(self, file_path: str, dataset_path: str) -> frozenset:
+        """
+        Collect the NumPy dtype kinds stored in a dataset, or in the
+        block*_values datasets of a DataFrame group, from metadata only.
+        """
         try:
-            with h5py.File(file_path, 'r') as f:
-                obj = f[dataset_path]
-                if isinstance(obj, h5py.Dataset):
-                    return np.issubdtype(obj.dtype, np.number)
-                elif isinstance(obj, h5py.Group):
-                    try:
-                        # Try to load a small sample as DataFrame and check dtypes
-                        df_sample = pd.read_hdf(file_path, key=dataset_path, stop=1)
-                        return any(pd.api.types.is_numeric_dtype(df_sample[col]) for col in df_sample.columns)
-                    except Exception as e:
-                        # Fallback for groups not directly readable by pd.read_hdf
-                        for key in obj.keys():
-                            if key.endswith('_values') and isinstance(obj[key], h5py.Dataset):
-                                if np.issubdtype(obj[key].dtype, np.number):
-                                    return True
-                    return False
+            key = (file_path, os.stat(file_path).st_mtime_ns, dataset_path)
+            kinds = self._kinds_cache.get(key)
+            if kinds is None:
+                kinds = self._kinds_cache[key] = self._probe_kinds_uncached(file_path, dataset_path)
+            return kinds
         except Exception:
-            return False
\ No newline at end of file
+            return frozenset()
+
+    def _probe_kinds_uncached(self, file_path: str, dataset_path: str) -> frozenset:
+        """Dtype kind lookup behind _probe_kinds"""
+        obj = self._get_file(file_path)[dataset_path]
+        if isinstance(obj, h5py.Dataset):
+            return frozenset(obj.dtype.kind)
+
+        kinds = set()
+        if isinstance(obj, h5py.Group):
+            for key in obj.keys():
+                if not key.endswith('_values') or not isinstance(obj[key], h5py.Dataset):
+                    continue
+                values = obj[key]
+                # pandas stores datetimes as int64 and booleans as bitfields,
+                # so recover the logical kind from the block's metadata
+                value_type = values.attrs.get('value_type', b'')
+                if value_type.startswith(b'datetime64'):
+                    kinds.add('M')
+                elif value_type.startswith(b'timedelta64'):
+                    kinds.add('m')
+                elif values.id.get_type().get_class() == h5py.h5t.BITFIELD:
+                    kinds.add('b')
+                else:
+                    kinds.add(values.dtype.kind)
+        return frozenset(kinds)
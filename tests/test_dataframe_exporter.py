@@ -0,0 +1,37 @@
+"""Tests for core.dataframe_exporter"""
+import os
+import sys
+import tempfile
+import unittest
+
+import h5py
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.dataframe_exporter import DataFrameExporter
+
+
+class ExportDatasetTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.h5_path = os.path.join(self.tmpdir.name, 'data.h5')
+        self.csv_path = os.path.join(self.tmpdir.name, 'out.csv')
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_non_ascii_vlen_string_field(self):
+        dtype = np.dtype([('id', 'i4'), ('name', h5py.string_dtype('utf-8'))])
+        data = np.array([(1, 'alpha'), (2, 'béta'), (3, 'γ')], dtype=dtype)
+        with h5py.File(self.h5_path, 'w') as f:
+            f['records'] = data
+
+        DataFrameExporter().export_to_csv(self.h5_path, 'records', ['id', 'name'], None, self.csv_path)
+
+        with open(self.csv_path, encoding='utf-8') as f:
+            self.assertEqual(f.read(), 'id,name\n1,alpha\n2,béta\n3,γ\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+"""Tests for core.h5_file_handler"""
+import os
+import sys
+import tempfile
+import unittest
+
+import h5py
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.h5_file_handler import H5FileHandler
+
+
+def write_fixed_frame(group: h5py.Group, columns: np.ndarray, values: np.ndarray) -> None:
+    """Write a single-block frame in the layout of pandas' HDFStore 'fixed' format"""
+    # PyTables stores string attributes as fixed-length bytes
+    group.attrs['pandas_type'] = np.bytes_(b'frame')
+    group.attrs['axis0_variety'] = np.bytes_(b'regular')
+    group.attrs['axis1_variety'] = np.bytes_(b'regular')
+    group.attrs['nblocks'] = 1
+    group.attrs['block0_items_variety'] = np.bytes_(b'regular')
+    group['axis0'] = columns
+    group['axis0'].attrs['name'] = np.bytes_(b'N.')
+    group['axis1'] = np.arange(values.shape[0])
+    group['axis1'].attrs['name'] = np.bytes_(b'N.')
+    group['axis1'].attrs['kind'] = np.bytes_(b'integer')
+    group['block0_items'] = columns
+    group['block0_values'] = values
+    group['block0_values'].attrs['transposed'] = 1
+
+
+class ReadFixedFrameTest(unittest.TestCase):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix='.h5')
+        os.close(fd)
+        self.handler = H5FileHandler()
+
+    def tearDown(self):
+        self.handler.close_all()
+        os.remove(self.path)
+
+    def test_string_named_frame(self):
+        with h5py.File(self.path, 'w') as f:
+            write_fixed_frame(f.create_group('df'), np.array([b'a', b'b']), np.arange(20.0).reshape(10, 2))
+        frame = self.handler._read_fixed_frame(self.handler._get_file(self.path)['df'], (2, 4))
+        self.assertEqual(list(frame.columns), ['a', 'b'])
+        self.assertEqual(frame['b'].tolist(), [5.0, 7.0])
+
+    def test_integer_named_frame_falls_back(self):
+        with h5py.File(self.path, 'w') as f:
+            write_fixed_frame(f.create_group('df'), np.array([0, 1]), np.arange(20.0).reshape(10, 2))
+        self.assertIsNone(self.handler._read_fixed_frame(self.handler._get_file(self.path)['df'], None))
+
+    def test_mismatched_block_width_falls_back(self):
+        with h5py.File(self.path, 'w') as f:
+            write_fixed_frame(f.create_group('df'), np.array([b'a', b'b']), np.arange(30.0).reshape(10, 3))
+        self.assertIsNone(self.handler._read_fixed_frame(self.handler._get_file(self.path)['df'], None))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,19 +5,42 @@ Handles the dataset inspection window with column search and pagination
 
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 import ttkbootstrap as ttkb
 from ttkbootstrap.constants import *
-from typing import Optional, List, Any, Dict
-import pandas as pd
+from typing import Optional, List, Any, Dict, Tuple
 import numpy as np
 
-from core.h5_file_handler import H5FileHandler
+from core.h5_file_handler import DatasetInfo, H5FileHandler
 from core.data_formatter import DataFormatter
 
+# Delay between the last keystroke in the search box and re-filtering
+SEARCH_DEBOUNCE_MS = 120
+# How often a running search is checked for its result
+SEARCH_POLL_MS = 20
+# Number of recent searches whose matches are kept to narrow later searches
+SEARCH_CACHE_SIZE = 16
+
 
 class DatasetInspector:
     """Handles dataset inspection window with column search and pagination"""
     
+    __slots__ = (
+        'parent', 'inspector_window', 'file_handler', 'formatter',
+        # Data management
+        'current_file_path', 'current_dataset_path', 'all_columns', '_all_columns_array',
+        '_all_columns_lower', '_column_index', 'filtered_columns', 'column_data_cache',
+        '_preview_text', '_preview_type',
+        # Pagination
+        'columns_per_page', 'current_page', 'total_pages',
+        # Search
+        'search_var', '_search_after_id', '_search_executor', '_search_future', '_search_cache',
+        '_prefetch_after_id',
+        # UI elements
+        'page_label', 'results_label', 'columns_frame', 'tree', 'info_label', '_rendered_columns',
+    )
+    
     def __init__(self, parent: tk.Tk):
         self.parent = parent
         self.inspector_window: Optional[tk.Toplevel] = None
@@ -28,20 +51,40 @@ class DatasetInspector:
         self.current_file_path: Optional[str] = None
         self.current_dataset_path: Optional[str] = None
         self.all_columns: List[str] = []
+        # Column names and their lowercased forms as arrays, so the search
+        # filter runs as one vectorized match
+        self._all_columns_array: np.ndarray = np.array([], dtype=object)
+        self._all_columns_lower: np.ndarray = np.array([], dtype=str)
+        # Position of each column name in all_columns (first occurrence)
+        self._column_index: Dict[str, int] = {}
         self.filtered_columns: List[str] = []
-        self.column_data_cache: Dict[str, List[Any]] = {}
+        # First (up to) 3 values of each column, formatted only when shown
+        self.column_data_cache: Dict[str, np.ndarray] = {}
+        # Preview text and type name of each column, indexed like all_columns
+        # and filled in the first time the column is drawn
+        self._preview_text: List[Optional[str]] = []
+        self._preview_type: List[Optional[str]] = []
         
         # Pagination
-        self.columns_per_page = 100
+        self.columns_per_page = 500
         self.current_page = 0
         self.total_pages = 0
         
         # UI elements
         self.search_var: Optional[tk.StringVar] = None
+        self._search_after_id: Optional[str] = None
+        # Searches run off the Tk thread; only the latest one is applied
+        self._search_executor = ThreadPoolExecutor(max_workers=1)
+        self._search_future: Optional[Future] = None
+        # Indices of the columns matching recent queries, most recent last
+        self._search_cache: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._prefetch_after_id: Optional[str] = None
         self.page_label: Optional[ttkb.Label] = None
         self.columns_frame: Optional[ttkb.Frame] = None
-        self.canvas: Optional[tk.Canvas] = None
-        self.scrollable_frame: Optional[ttkb.Frame] = None
+        self.tree: Optional[ttk.Treeview] = None
+        # Columns currently shown in the tree, to skip re-rendering the same page
+        self._rendered_columns: Optional[List[str]] = None
+        self.info_label: Optional[ttkb.Label] = None
     
     def inspect_dataset(self, file_path: str, dataset_path: str) -> None:
         """
@@ -52,27 +95,42 @@ class DatasetInspector:
             dataset_path: Path to the dataset within the file
         """
         try:
-            self.current_file_path = file_path
-            self.current_dataset_path = dataset_path
-            
             # Get dataset information
-            info = self.file_handler.get_dataset_info(file_path, dataset_path)
-            
-            # Get column information
-            self.all_columns = info.get('columns', [])
+            info = self.file_handler.get_dataset_info(file_path, dataset_path, include_columns=True)
+            columns = list(info.columns or [])
             
-            if not self.all_columns:
+            # Checked before any state changes, so a hidden window kept for
+            # reuse still matches the dataset it shows
+            if not columns:
                 messagebox.showerror("Error", 
                     "This dataset doesn't appear to have identifiable columns. "
                     "Column exploration is only available for tabular datasets.")
                 return
             
+            self.current_file_path = file_path
+            self.current_dataset_path = dataset_path
+            
+            # Get column information
+            self.all_columns = columns
+            self._all_columns_array = np.array(self.all_columns, dtype=object)
+            self._all_columns_lower = np.char.lower(np.array(self.all_columns, dtype=str))
+            if all(map(str.isascii, self.all_columns)):
+                # Plain ASCII names are searched as bytes, a quarter the size to scan
+                self._all_columns_lower = self._all_columns_lower.astype(np.bytes_)
+            self._column_index = {}
+            self._search_cache.clear()
+            for i, col in enumerate(self.all_columns):
+                self._column_index.setdefault(col, i)
+            
             # Initialize filtered columns and pagination
             self.filtered_columns = self.all_columns.copy()
             self._calculate_pagination()
             
-            # Load first few rows of data for preview
-            self._load_column_previews()
+            # Previews are read page by page as columns are shown
+            self.column_data_cache = {}
+            self._preview_text = [None] * len(self.all_columns)
+            self._preview_type = [None] * len(self.all_columns)
+            self._rendered_columns = None
             
             # Create inspector window
             self._create_inspector_window(info)
@@ -80,61 +138,68 @@ class DatasetInspector:
         except Exception as e:
             messagebox.showerror("Error", f"Failed to inspect dataset: {str(e)}")
     
-    def _load_column_previews(self) -> None:
-        """Load the first 3 rows of data for column previews"""
+    def _ensure_previews_loaded(self, columns: List[str]) -> None:
+        """
+        Load the first 3 rows of data for the given columns' previews,
+        reading only the columns that are not cached yet
+        
+        Args:
+            columns: Column names about to be displayed
+        """
+        import pandas as pd
+        
+        missing = [col for col in dict.fromkeys(columns) if col not in self.column_data_cache]
+        if not missing:
+            return
+        
         try:
-            self.column_data_cache.clear()
-            
-            # Read first 3 rows of the dataset
+            # Read first 3 rows of just the missing columns (plain arrays
+            # have no fields, so they come back whole)
             sample_data = self.file_handler.read_dataset(
                 self.current_file_path, 
                 self.current_dataset_path, 
-                slice_rows=(0, 3)  # First 3 rows
+                slice_rows=(0, 3),  # First 3 rows
+                fields=missing
             )
             
             if isinstance(sample_data, pd.DataFrame):
                 # For pandas DataFrame
-                for col in self.all_columns:
+                for col in missing:
                     if col in sample_data.columns:
-                        self.column_data_cache[col] = sample_data[col].tolist()
-                    else:
-                        self.column_data_cache[col] = ["N/A", "N/A", "N/A"]
+                        values = sample_data[col]
+                        # Object dtype keeps datetimes as Timestamps
+                        self.column_data_cache[col] = values.to_numpy(
+                            dtype=object if values.dtype.kind == 'M' else None)[:3]
             else:
                 # For numpy array or other data types
                 if hasattr(sample_data, 'dtype') and sample_data.dtype.fields:
                     # Structured array
-                    for col in self.all_columns:
+                    for col in missing:
                         if col in sample_data.dtype.names:
-                            self.column_data_cache[col] = sample_data[col][:3].tolist()
-                        else:
-                            self.column_data_cache[col] = ["N/A", "N/A", "N/A"]
+                            self.column_data_cache[col] = sample_data[col][:3]
                 else:
-                    # Regular array - create generic column names
+                    # Regular array - the read covers every column, so cache them all
                     for i, col in enumerate(self.all_columns):
-                        if i < sample_data.shape[1] if len(sample_data.shape) > 1 else 1:
-                            if len(sample_data.shape) > 1:
-                                self.column_data_cache[col] = sample_data[:3, i].tolist()
-                            else:
-                                self.column_data_cache[col] = sample_data[:3].tolist()
-                        else:
-                            self.column_data_cache[col] = ["N/A", "N/A", "N/A"]
-            
-            # Ensure all columns have exactly 3 preview values
-            for col in self.all_columns:
-                if col not in self.column_data_cache:
-                    self.column_data_cache[col] = ["N/A", "N/A", "N/A"]
-                else:
-                    # Pad with N/A if less than 3 values
-                    while len(self.column_data_cache[col]) < 3:
-                        self.column_data_cache[col].append("N/A")
-                    # Truncate if more than 3 values
-                    self.column_data_cache[col] = self.column_data_cache[col][:3]
+                        if col in self.column_data_cache:
+                            continue
+                        if len(sample_data.shape) > 1:
+                            if i < sample_data.shape[1]:
+                                self.column_data_cache[col] = sample_data[:3, i]
+                        elif i == 0:
+                            self.column_data_cache[col] = sample_data[:3]
                         
         except Exception as e:
             print(f"Warning: Could not load column previews: {str(e)}")
-            # Fallback: create empty previews
-            for col in self.all_columns:
-                self.column_data_cache[col] = ["N/A", "N/A", "N/A"]
+        
+        # Cache columns without data too, so they are not read again
+        for col in missing:
+            self.column_data_cache.setdefault(col, np.array([], dtype=object))
+    
+    def _prefetch_next_page(self) -> None:
+        """Load the previews of the page after the current one"""
+        self._prefetch_after_id = None
+        start_idx = (self.current_page + 1) * self.columns_per_page
+        self._ensure_previews_loaded(self.filtered_columns[start_idx:start_idx + self.columns_per_page])
     
     def _calculate_pagination(self) -> None:
         """Calculate pagination based on filtered columns"""
@@ -142,22 +207,25 @@ class DatasetInspector:
         if self.current_page >= self.total_pages:
             self.current_page = max(0, self.total_pages - 1)
     
-    def _create_inspector_window(self, info: dict) -> None:
+    def _create_inspector_window(self, info: DatasetInfo) -> None:
         """
         Create and display the redesigned dataset inspector window
         
         Args:
             info: Dataset information dictionary
         """
-        # Close existing inspector window if open
-        if self.inspector_window:
-            self.inspector_window.destroy()
+        # Reuse the window of an earlier inspection; only its contents change
+        if self.inspector_window and self.inspector_window.winfo_exists():
+            self._refresh_inspector_window(info)
+            return
         
         # Create new window
         self.inspector_window = ttkb.Toplevel(self.parent)
-        self.inspector_window.title(f"Dataset Inspector - {info['path']}")
+        self.inspector_window.title(f"Dataset Inspector - {info.path}")
         self.inspector_window.geometry("780x550")
         self.inspector_window.resizable(True, True)
+        # Closing only hides the window so the next inspection can reuse it
+        self.inspector_window.protocol("WM_DELETE_WINDOW", self._hide_inspector)
         
         # Configure grid
         self.inspector_window.grid_rowconfigure(0, weight=1)
@@ -187,7 +255,28 @@ class DatasetInspector:
         # Initial column display
         self._update_column_display()
     
-    def _create_header(self, parent: ttkb.Frame, info: dict) -> None:
+    def _refresh_inspector_window(self, info: DatasetInfo) -> None:
+        """Show a new dataset in the existing inspector window"""
+        self.inspector_window.title(f"Dataset Inspector - {info.path}")
+        self.info_label.config(text=self._header_text(info))
+        
+        # Clear the search and redraw the first page right away
+        self.search_var.set("")
+        self._apply_search()
+        
+        self.inspector_window.deiconify()
+        self.inspector_window.lift()
+    
+    def _hide_inspector(self) -> None:
+        """Hide the inspector window, keeping its widgets for the next inspection"""
+        if self.inspector_window:
+            self.inspector_window.withdraw()
+    
+    def _header_text(self, info: DatasetInfo) -> str:
+        """Dataset summary shown under the header title"""
+        return f"Dataset: {info.path} | Shape: {info.shape} | Columns: {len(self.all_columns)}"
+    
+    def _create_header(self, parent: ttkb.Frame, info: DatasetInfo) -> None:
         """Create the header with dataset information"""
         header_frame = ttkb.Frame(parent)
         header_frame.grid(row=0, column=0, sticky=(W, E), pady=(0, 15))
@@ -199,10 +288,9 @@ class DatasetInspector:
         title_label.grid(row=0, column=0, sticky=W)
         
         # Dataset info
-        info_text = f"Dataset: {info['path']} | Shape: {info['shape']} | Columns: {len(self.all_columns)}"
-        info_label = ttkb.Label(header_frame, text=info_text, 
-                              font=("Segoe UI", 10), bootstyle="secondary")
-        info_label.grid(row=1, column=0, sticky=W, pady=(5, 0))
+        self.info_label = ttkb.Label(header_frame, text=self._header_text(info), 
+                                   font=("Segoe UI", 10), bootstyle="secondary")
+        self.info_label.grid(row=1, column=0, sticky=W, pady=(5, 0))
     
     def _create_search_bar(self, parent: ttkb.Frame) -> None:
         """Create the search bar for filtering columns"""
@@ -244,30 +332,27 @@ class DatasetInspector:
         display_frame.grid_rowconfigure(0, weight=1)
         display_frame.grid_columnconfigure(0, weight=1)
         
-        # Create canvas and scrollbar
-        self.canvas = tk.Canvas(display_frame, highlightthickness=0)
+        # A Treeview only draws the rows in view, so a page is one widget
+        # rather than a frame and three labels per column
+        self.tree = ttk.Treeview(display_frame, columns=("column", "preview", "type"),
+                                 show="headings", selectmode="browse")
         scrollbar = ttkb.Scrollbar(display_frame, orient="vertical", 
-                                 command=self.canvas.yview)
-        self.scrollable_frame = ttkb.Frame(self.canvas)
+                                 command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scrollbar.set)
         
-        # Configure scrolling
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        )
+        self.tree.heading("column", text="Column", anchor=W)
+        self.tree.heading("preview", text="Preview (first 3 rows)", anchor=W)
+        self.tree.heading("type", text="Type", anchor=W)
+        self.tree.column("column", width=240, stretch=False)
+        self.tree.column("preview", width=400, stretch=True)
+        self.tree.column("type", width=90, stretch=False)
         
-        self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
-        self.canvas.configure(yscrollcommand=scrollbar.set)
+        # Shown in place of the columns when a search matches none
+        self.tree.tag_configure("no_results", foreground=ttkb.Style().colors.secondary)
         
-        # Grid canvas and scrollbar
-        self.canvas.grid(row=0, column=0, sticky=NSEW)
+        # Grid tree and scrollbar
+        self.tree.grid(row=0, column=0, sticky=NSEW)
         scrollbar.grid(row=0, column=1, sticky=(N, S))
-        
-        # Configure scrollable frame
-        self.scrollable_frame.grid_columnconfigure(0, weight=1)
-        
-        # Bind mouse wheel
-        self._bind_mouse_wheel()
     
     def _create_pagination_controls(self, parent: ttkb.Frame) -> None:
         """Create pagination controls"""
@@ -292,64 +377,122 @@ class DatasetInspector:
         
         # Close button
         close_btn = ttkb.Button(pagination_frame, text="Close", 
-                              command=self.inspector_window.destroy, 
+                              command=self._hide_inspector, 
                               bootstyle="danger")
         close_btn.grid(row=0, column=3, sticky=E)
         
         # Update page info
         self._update_page_info()
     
-    def _bind_mouse_wheel(self) -> None:
-        """Bind mouse wheel scrolling to canvas"""
-        def on_mousewheel(event):
-            self.canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-        
-        # Different binding for different platforms
-        self.canvas.bind("<MouseWheel>", on_mousewheel)  # Windows
-        self.canvas.bind("<Button-4>", lambda e: self.canvas.yview_scroll(-1, "units"))  # Linux
-        self.canvas.bind("<Button-5>", lambda e: self.canvas.yview_scroll(1, "units"))   # Linux
-        
-        # Enable scrolling when mouse is over the canvas
-        def bind_to_mousewheel(event):
-            self.canvas.bind_all("<MouseWheel>", on_mousewheel)
-            self.canvas.bind_all("<Button-4>", lambda e: self.canvas.yview_scroll(-1, "units"))
-            self.canvas.bind_all("<Button-5>", lambda e: self.canvas.yview_scroll(1, "units"))
-        
-        def unbind_from_mousewheel(event):
-            self.canvas.unbind_all("<MouseWheel>")
-            self.canvas.unbind_all("<Button-4>")
-            self.canvas.unbind_all("<Button-5>")
-        
-        self.canvas.bind('<Enter>', bind_to_mousewheel)
-        self.canvas.bind('<Leave>', unbind_from_mousewheel)
-    
     def _on_search_changed(self, *args) -> None:
-        """Handle search text changes"""
-        search_text = self.search_var.get().lower()
-        
-        if not search_text:
-            self.filtered_columns = self.all_columns.copy()
+        """Handle search text changes, filtering once typing pauses"""
+        if self._search_after_id:
+            self.inspector_window.after_cancel(self._search_after_id)
+        self._search_after_id = self.inspector_window.after(SEARCH_DEBOUNCE_MS, self._apply_search)
+    
+    def _apply_search(self) -> None:
+        """Filter the columns by the current search text"""
+        if self._search_after_id:
+            self.inspector_window.after_cancel(self._search_after_id)
+            self._search_after_id = None
+        
+        # Supersede any search still running
+        if self._search_future:
+            self._search_future.cancel()
+            self._search_future = None
+        
+        search_terms = self.search_var.get().lower().split()
+        query = " ".join(search_terms)
+        
+        if not search_terms:
+            self._show_search_results(self.all_columns.copy())
+        elif query in self._search_cache:
+            self._search_cache.move_to_end(query)
+            self._show_search_results(self._all_columns_array[self._search_cache[query]].tolist())
         else:
-            self.filtered_columns = [
-                col for col in self.all_columns
-                if search_text in col.lower()
-            ]
+            # A query extending an earlier one can only match a subset of its
+            # columns, so only those need scanning
+            candidates = None
+            for previous in reversed(self._search_cache):
+                if query.startswith(previous) and (
+                        candidates is None or len(self._search_cache[previous]) < len(candidates)):
+                    candidates = self._search_cache[previous]
+            
+            # Filter in the background so long column lists don't block typing
+            self._search_future = self._search_executor.submit(
+                self._filter_columns, self._all_columns_array, self._all_columns_lower,
+                search_terms, candidates)
+            self.inspector_window.after(SEARCH_POLL_MS, self._poll_search, self._search_future, query)
+    
+    @staticmethod
+    def _filter_columns(columns: np.ndarray, columns_lower: np.ndarray, search_terms: List[str],
+                        candidates: Optional[np.ndarray] = None) -> Tuple[np.ndarray, List[str]]:
+        """
+        Find the columns whose lowercased name contains every search term
+        
+        Args:
+            columns: Column names
+            columns_lower: Lowercased column names
+            search_terms: Lowercased terms to match
+            candidates: Indices of the only columns to check, or None for all
+            
+        Returns:
+            Indices and names of the matching columns
+        """
+        if candidates is None:
+            candidates = np.arange(len(columns))
+        if columns_lower.dtype.kind == 'S':
+            # ASCII-only names can't contain a non-ASCII term
+            if not all(map(str.isascii, search_terms)):
+                return candidates[:0], []
+            search_terms = [term.encode('ascii') for term in search_terms]
+        candidates_lower = columns_lower[candidates]
+        matches = np.char.find(candidates_lower, search_terms[0]) >= 0
+        for term in search_terms[1:]:
+            matches &= np.char.find(candidates_lower, term) >= 0
+        indices = candidates[matches]
+        return indices, columns[indices].tolist()
+    
+    def _poll_search(self, future: Future, query: str) -> None:
+        """Show a background search's result once it is ready"""
+        # Tk widgets may only be touched from the main thread, so the result
+        # is picked up here rather than in a done-callback
+        if future is not self._search_future:
+            return  # Superseded by a newer search or the window closed
+        if not future.done():
+            self.inspector_window.after(SEARCH_POLL_MS, self._poll_search, future, query)
+            return
+        self._search_future = None
+        indices, filtered_columns = future.result()
         
-        # Reset pagination
+        self._search_cache[query] = indices
+        if len(self._search_cache) > SEARCH_CACHE_SIZE:
+            self._search_cache.popitem(last=False)
+        self._show_search_results(filtered_columns)
+    
+    def _show_search_results(self, filtered_columns: List[str]) -> None:
+        """Display filtered columns from the first page"""
+        self.filtered_columns = filtered_columns
+        self._refresh_after_filter()
+        self._update_column_display()
+    
+    def _refresh_after_filter(self) -> None:
+        """Reset pagination to the first page and update both info labels"""
+        filtered_cols = len(self.filtered_columns)
         self.current_page = 0
-        self._calculate_pagination()
-        self._update_results_info()
+        self.total_pages = max(1, (filtered_cols - 1) // self.columns_per_page + 1)
+        self._update_results_info(filtered_cols)
         self._update_page_info()
-        self._update_column_display()
     
     def _clear_search(self) -> None:
         """Clear the search field"""
         self.search_var.set("")
     
-    def _update_results_info(self) -> None:
+    def _update_results_info(self, filtered_cols: Optional[int] = None) -> None:
         """Update the results information label"""
         total_cols = len(self.all_columns)
-        filtered_cols = len(self.filtered_columns)
+        if filtered_cols is None:
+            filtered_cols = len(self.filtered_columns)
         
         if filtered_cols == total_cols:
             text = f"Showing all {total_cols} columns"
@@ -381,101 +524,94 @@ class DatasetInspector:
     
     def _update_column_display(self) -> None:
         """Update the column display with current page data"""
-        # Clear existing widgets
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
-        
         # Calculate column range for current page
         start_idx = self.current_page * self.columns_per_page
         end_idx = min(start_idx + self.columns_per_page, len(self.filtered_columns))
         page_columns = self.filtered_columns[start_idx:end_idx]
         
+        # A search can land on the page already shown, e.g. after retyping a
+        # deleted character; leave the tree as it is then
+        if page_columns == self._rendered_columns:
+            return
+        self._rendered_columns = page_columns
+        
+        self._ensure_previews_loaded(page_columns)
+        
+        self.tree.delete(*self.tree.get_children())
+        
         if not page_columns:
             # No columns to display
-            no_results_label = ttkb.Label(self.scrollable_frame, 
-                                        text="No columns match your search criteria",
-                                        font=("Segoe UI", 12, "italic"), 
-                                        bootstyle="secondary")
-            no_results_label.grid(row=0, column=0, pady=50)
+            self.tree.insert("", "end", values=("No columns match your search criteria", "", ""),
+                             tags=("no_results",))
             return
         
-        # Create column widgets
-        for i, column_name in enumerate(page_columns):
-            column_index = self.all_columns.index(column_name) if column_name in self.all_columns else -1
-            self._create_column_widget(i, column_index, column_name)
+        for column_name in page_columns:
+            column_index = self._column_index.get(column_name, -1)
+            preview_text, dtype_info = self._preview_strings(column_index, column_name)
+            self.tree.insert("", "end", values=(f"{column_index}. {column_name}", preview_text, dtype_info))
         
-        # Update canvas scroll region
-        self.scrollable_frame.update_idletasks()
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        self.canvas.yview_moveto(0)  # Scroll to top
+        self.tree.yview_moveto(0)  # Scroll to top
+        
+        # Read the next page's previews once the UI is idle, so paging forward is instant
+        if self._prefetch_after_id:
+            self.inspector_window.after_cancel(self._prefetch_after_id)
+        self._prefetch_after_id = self.inspector_window.after_idle(self._prefetch_next_page)
     
-    def _create_column_widget(self, row: int, column_index: int, column_name: str) -> None:
-        """Create a compact widget displaying column name, preview data, and type"""
-        # Main column frame
-        col_frame = ttkb.Frame(self.scrollable_frame, padding=5)
-        col_frame.grid(row=row, column=0, sticky=(W, E), padx=2, pady=0)
-        col_frame.grid_columnconfigure(0, weight=0)
-        col_frame.grid_columnconfigure(1, weight=1)
-
-        # Get preview data
-        preview_data = self.column_data_cache.get(column_name, ["N/A", "N/A", "N/A"])
-        formatted_values = [self._format_preview_value(v) for v in preview_data]
+    def _preview_strings(self, column_index: int, column_name: str) -> Tuple[str, str]:
+        """Get a column's preview text and type name, formatting them on first use"""
+        if column_index >= 0 and self._preview_text[column_index] is not None:
+            return self._preview_text[column_index], self._preview_type[column_index]
+        
+        values = self.column_data_cache.get(column_name, np.array([], dtype=object))[:3]
+        # Pad with N/A if less than 3 values
+        formatted_values = self._format_preview_array(values)
+        formatted_values += ["N/A"] * (3 - len(formatted_values))
         preview_text = ", ".join(formatted_values)
+        dtype_info = self._infer_dtype(values[0] if len(values) else "N/A")
+        
+        # Only memoize once the column's previews have been loaded
+        if column_index >= 0 and column_name in self.column_data_cache:
+            self._preview_text[column_index] = preview_text
+            self._preview_type[column_index] = dtype_info
+        return preview_text, dtype_info
 
-        # First row: column name (bold/primary) + preview values (not bold/secondary)
-        name_label = ttkb.Label(
-            col_frame,
-            text=f"{column_index}. {column_name}:",
-            font=("Segoe UI", 10, "bold"),
-            bootstyle="primary"
-        )
-        name_label.grid(row=0, column=0, sticky=W)
-
-        preview_label = ttkb.Label(
-            col_frame,
-            text=f" {preview_text}",
-            font=("Segoe UI", 8),  # Not bold
-            bootstyle="success"
-        )
-        preview_label.grid(row=0, column=1, sticky=W)
-
-        # Second row: data type
-        try:
-            sample = preview_data[0]
-            if isinstance(sample, str):
-                dtype_info = "string"
-            elif isinstance(sample, (int, np.integer)):
-                dtype_info = "integer"
-            elif isinstance(sample, (float, np.floating)):
-                dtype_info = "float"
-            else:
-                dtype_info = type(sample).__name__
-        except:
-            dtype_info = "unknown"
-
-        type_label = ttkb.Label(
-            col_frame,
-            text=f"Type: {dtype_info}",
-            font=("Segoe UI", 8, "italic"),
-            bootstyle="secondary"
-        )
-        type_label.grid(row=1, column=0, columnspan=2, sticky=W, pady=(2, 0))
-
+    @staticmethod
+    def _infer_dtype(sample: Any) -> str:
+        """Name the type of a column from its first preview value"""
+        if isinstance(sample, str):
+            return "string"
+        elif isinstance(sample, (int, np.integer)):
+            return "integer"
+        elif isinstance(sample, (float, np.floating)):
+            return "float"
+        else:
+            return type(sample).__name__
     
-    def _format_preview_value(self, value: Any) -> str:
-        """Format a preview value for display"""
-        if value is None or pd.isna(value):
-            return "N/A"
-        
-        # Convert value to string
-        str_value = str(value)
-        
-        # Truncate long strings
-        max_length = 60
-        if len(str_value) > max_length:
-            return str_value[:max_length] + "..."
+    def _format_preview_array(self, values: np.ndarray) -> List[str]:
+        """Format preview values for display, checking for missing values in one call"""
+        import pandas as pd
+        
+        missing = pd.isna(values)
+        if missing.ndim > 1:
+            # Subarray fields: an entry is missing only if all its elements are
+            missing = missing.reshape(len(values), -1).all(axis=1)
+        
+        formatted = []
+        for value, is_missing in zip(values, missing.tolist()):
+            if is_missing:
+                formatted.append("N/A")
+                continue
+            
+            # Convert value to string
+            str_value = str(value)
+            
+            # Truncate long strings
+            max_length = 60
+            if len(str_value) > max_length:
+                str_value = str_value[:max_length] + "..."
+            formatted.append(str_value)
         
-        return str_value
+        return formatted
     
     def _center_window(self) -> None:
         """Center the inspector window on screen"""
@@ -492,5 +628,16 @@ class DatasetInspector:
     def close_inspector(self) -> None:
         """Close the inspector window if it exists"""
         if self.inspector_window:
+            if self._search_after_id:
+                self.inspector_window.after_cancel(self._search_after_id)
+                self._search_after_id = None
+            if self._prefetch_after_id:
+                self.inspector_window.after_cancel(self._prefetch_after_id)
+                self._prefetch_after_id = None
+            if self._search_future:
+                self._search_future.cancel()
+                self._search_future = None
             self.inspector_window.destroy()
-            self.inspector_window = None
\ No newline at end of file
+            self.inspector_window = None
+        self._search_executor.shutdown(wait=True, cancel_futures=True)
+        self.file_handler.close_all()
\ No newline at end of file
@@ -3,14 +3,30 @@ Dataset List UI Module
 Handles the scrollable list of datasets
 """
 
+import queue
+import re
 import tkinter as tk
 from tkinter import ttk
-from typing import List, Callable, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Callable, Optional, Dict, Tuple
 import ttkbootstrap as ttkb
 from ttkbootstrap.constants import *
 
 from core.h5_file_handler import H5FileHandler
 
+# How often results of the background exportability check are applied
+PROBE_POLL_MS = 50
+# Datasets checked between hand-offs of results to the Tk thread
+PROBE_BATCH_SIZE = 50
+# Delay between the last keystroke in the search box and re-filtering
+SEARCH_DEBOUNCE_MS = 150
+# Rows inserted into the list at a time; longer lists are paged
+DATASETS_PER_PAGE = 1000
+
+# Index and column-name arrays inside a pandas HDFStore frame group. They are
+# always 1-D, so they are never exportable and needn't be probed.
+_FRAME_INDEX_PATH_RE = re.compile(r'^(.+)/(axis\d+[^/]*|block\d+_items)$')
+
 
 class DatasetList:
     """Handles the scrollable dataset list UI"""
@@ -19,22 +35,37 @@ class DatasetList:
         self.parent = parent
         self.callback = callback
         self.datasets: List[str] = []
+        # Lowercased dataset paths, built once per file for searching
+        self._datasets_lower: List[str] = []
         self.current_file_path: Optional[str] = None
         
         # Add file handler for checking exportable datasets
         self.file_handler = H5FileHandler()
+        # Exportability of each dataset in the current file, so filtering
+        # the list doesn't probe HDF5 again
+        self._exportable_cache: Dict[str, bool] = {}
+        # Exportability is checked off the Tk thread; results of a check
+        # started for an older file (an older generation) are dropped
+        self._probe_executor = ThreadPoolExecutor(max_workers=1)
+        self._probe_generation = 0
+        self._probe_future: Optional[Future] = None
         
         # UI elements
         self.list_frame: Optional[ttk.LabelFrame] = None
         self.no_file_label: Optional[ttk.Label] = None
         self.scroll_container: Optional[ttk.Frame] = None
-        self.canvas: Optional[tk.Canvas] = None
+        self.tree: Optional[ttk.Treeview] = None
         self.scrollbar: Optional[ttk.Scrollbar] = None
-        self.scrollable_frame: Optional[ttk.Frame] = None
-        self.dataset_buttons: List[ttk.Button] = []
+        self.summary_label: Optional[ttk.Label] = None
         self.search_var: Optional[tk.StringVar] = None
         self.search_entry: Optional[ttk.Entry] = None
+        self._search_after_id: Optional[str] = None
         self.filtered_datasets: List[str] = []
+        
+        # Pagination
+        self.current_page = 0
+        self.page_frame: Optional[ttk.Frame] = None
+        self.page_label: Optional[ttk.Label] = None
     
     def create_ui(self, row: int) -> None:
         """
@@ -88,10 +119,11 @@ class DatasetList:
     
     def _show_no_file_message(self) -> None:
         """Show the 'no file loaded' message"""
-        self.no_file_label = ttk.Label(self.list_frame, 
-                                      text="Load an H5 file to view datasets",
-                                      font=("TkDefaultFont", 11, "italic"),
-                                      foreground="gray")
+        if self.no_file_label is None:
+            self.no_file_label = ttk.Label(self.list_frame, 
+                                          text="Load an H5 file to view datasets",
+                                          font=("TkDefaultFont", 11, "italic"),
+                                          foreground="gray")
         self.no_file_label.grid(row=1, column=0, pady=50)
     
     def _hide_no_file_message(self) -> None:
@@ -100,10 +132,13 @@ class DatasetList:
             self.no_file_label.grid_remove()
     
     def _create_scrollable_list(self) -> None:
-        """Create the scrollable dataset list"""
-        # Remove existing scroll container if present
+        """Create the scrollable dataset list, or empty and show the existing one"""
+        # Reuse the list built for an earlier file
         if self.scroll_container:
-            self.scroll_container.destroy()
+            self.tree.delete(*self.tree.get_children())
+            self.tree.yview_moveto(0)
+            self.scroll_container.grid()
+            return
         
         # Create scroll container
         self.scroll_container = ttk.Frame(self.list_frame)
@@ -111,87 +146,89 @@ class DatasetList:
         self.scroll_container.grid_rowconfigure(0, weight=1)
         self.scroll_container.grid_columnconfigure(0, weight=1)
         
-        # Create canvas and scrollbar
-        self.canvas = tk.Canvas(self.scroll_container, highlightthickness=0)
+        # A Treeview only draws the rows in view, so large files don't
+        # create a widget per dataset
+        self.tree = ttk.Treeview(self.scroll_container, show="tree", selectmode="browse", cursor="hand2")
         self.scrollbar = ttk.Scrollbar(self.scroll_container, orient="vertical", 
-                                     command=self.canvas.yview)
-        self.scrollable_frame = ttk.Frame(self.canvas)
+                                     command=self.tree.yview)
+        self.tree.configure(yscrollcommand=self.scrollbar.set)
+        self.tree.column("#0", stretch=True)
         
-        # Configure scrolling
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        )
+        # Exportable datasets are shown in the success colour
+        self.tree.tag_configure("exportable", foreground=ttkb.Style().colors.success)
         
-        self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
-        self.canvas.configure(yscrollcommand=self.scrollbar.set)
-        
-        # Grid canvas and scrollbar
-        self.canvas.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        # Grid tree and scrollbar
+        self.tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         self.scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
         
-        # Configure scrollable frame
-        self.scrollable_frame.grid_columnconfigure(0, weight=1)
-        
-        # Bind mouse wheel to canvas
-        self._bind_mouse_wheel()
+        # Summary label
+        self.summary_label = ttk.Label(self.scroll_container, text="",
+                                     font=("TkDefaultFont", 8), foreground="gray")
+        self.summary_label.grid(row=1, column=0, columnspan=2, pady=(15, 5))
+        
+        # Page controls, shown only when the list has more than one page
+        self.page_frame = ttk.Frame(self.scroll_container)
+        self.page_frame.grid(row=2, column=0, columnspan=2, pady=(0, 5))
+        prev_btn = ttk.Button(self.page_frame, text="← Previous", command=self._previous_page)
+        prev_btn.grid(row=0, column=0, padx=(0, 10))
+        self.page_label = ttk.Label(self.page_frame, text="", font=("TkDefaultFont", 8))
+        self.page_label.grid(row=0, column=1)
+        next_btn = ttk.Button(self.page_frame, text="Next →", command=self._next_page)
+        next_btn.grid(row=0, column=2, padx=(10, 0))
+        self.page_frame.grid_remove()
+        
+        # Open a dataset on click or Enter
+        self.tree.bind("<ButtonRelease-1>", self._on_tree_click)
+        self.tree.bind("<Return>", self._on_tree_activate)
+    
+    def _on_tree_click(self, event) -> None:
+        """Open the dataset under the mouse pointer"""
+        dataset_path = self.tree.identify_row(event.y)
+        if dataset_path:
+            self.callback(dataset_path)
     
-    def _bind_mouse_wheel(self) -> None:
-        """Bind mouse wheel scrolling to canvas"""
-        def on_mousewheel(event):
-            self.canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-        
-        def on_mousewheel_linux(event):
-            self.canvas.yview_scroll(int(-1 * event.delta), "units")
-        
-        # Different binding for different platforms
-        self.canvas.bind("<MouseWheel>", on_mousewheel)  # Windows
-        self.canvas.bind("<Button-4>", lambda e: self.canvas.yview_scroll(-1, "units"))  # Linux
-        self.canvas.bind("<Button-5>", lambda e: self.canvas.yview_scroll(1, "units"))   # Linux
-        
-        # Enable scrolling when mouse is over the canvas
-        def bind_to_mousewheel(event):
-            self.canvas.bind_all("<MouseWheel>", on_mousewheel)
-            self.canvas.bind_all("<Button-4>", lambda e: self.canvas.yview_scroll(-1, "units"))
-            self.canvas.bind_all("<Button-5>", lambda e: self.canvas.yview_scroll(1, "units"))
-        
-        def unbind_from_mousewheel(event):
-            self.canvas.unbind_all("<MouseWheel>")
-            self.canvas.unbind_all("<Button-4>")
-            self.canvas.unbind_all("<Button-5>")
-        
-        self.canvas.bind('<Enter>', bind_to_mousewheel)
-        self.canvas.bind('<Leave>', unbind_from_mousewheel)
+    def _on_tree_activate(self, event) -> None:
+        """Open the focused dataset"""
+        dataset_path = self.tree.focus()
+        if dataset_path:
+            self.callback(dataset_path)
     
-    def _is_exportable_dataframe(self, dataset_path: str) -> bool:
+    def _is_exportable_dataframe(self, file_path: str, dataset_path: str) -> bool:
         """
         Check if a dataset is exportable as a DataFrame
         
         Args:
+            file_path: Path to the HDF5 file
             dataset_path: Path to the dataset
             
         Returns:
             True if the dataset can be exported as a DataFrame, False otherwise
         """
-        if not self.current_file_path:
+        if not file_path:
             return False
             
         try:
             # Get dataset information
-            info = self.file_handler.get_dataset_info(self.current_file_path, dataset_path)
+            info = self.file_handler.get_dataset_info(file_path, dataset_path)
             
-            # Check if it has identifiable columns
-            has_columns = 'columns' in info and info['columns'] and len(info['columns']) > 0
+            # Check if it has identifiable columns. Shallow info leaves the columns
+            # of dataframe groups unread; their count is in the shape when the
+            # row count could be found, and groups written by pandas count as
+            # tabular even when it couldn't ('Inferred' shape).
+            if info.columns is None:
+                has_columns = ((isinstance(info.shape, tuple) and len(info.shape) == 2 and info.shape[1] > 0)
+                               or 'pandas_type' in info.attributes)
+            else:
+                has_columns = bool(info.columns)
             
             # Check if it has a valid tabular shape
             has_valid_shape = False
-            if 'shape' in info:
-                if isinstance(info['shape'], tuple) and len(info['shape']) >= 1:
-                    # Must have at least some rows
-                    if isinstance(info['shape'][0], int) and info['shape'][0] > 0:
-                        has_valid_shape = True
-                elif info['shape'] == 'Inferred':  # For pandas HDFStore groups
+            if isinstance(info.shape, tuple) and len(info.shape) >= 1:
+                # Must have at least some rows
+                if isinstance(info.shape[0], int) and info.shape[0] > 0:
                     has_valid_shape = True
+            elif info.shape == 'Inferred':  # For pandas HDFStore groups
+                has_valid_shape = True
             
             # Dataset is exportable if it has both columns and valid shape
             is_exportable = has_columns and has_valid_shape
@@ -202,64 +239,127 @@ class DatasetList:
             print(f"Error checking exportability for {dataset_path}: {str(e)}")
             return False
     
-    def _create_dataset_buttons(self, datasets: List[str]) -> None:
+    def _start_exportability_check(self) -> None:
+        """Check which datasets of the current file are exportable on a worker thread"""
+        self._probe_generation += 1
+        results: queue.Queue = queue.Queue()
+        future = self._probe_executor.submit(self._probe_exportability, self.current_file_path,
+                                             list(self.datasets), self._probe_generation, results)
+        self._probe_future = future
+        self.parent.after(PROBE_POLL_MS, self._poll_exportability, future, self._probe_generation, results)
+    
+    def _probe_exportability(self, file_path: str, datasets: List[str], generation: int,
+                             results: queue.Queue) -> None:
+        """Check datasets' exportability, handing results over in batches (worker thread)"""
+        listed = set(datasets)
+        batch: List[Tuple[str, bool]] = []
+        for dataset_path in datasets:
+            if generation != self._probe_generation:
+                return  # Another file was loaded or the list was cleared
+            match = _FRAME_INDEX_PATH_RE.match(dataset_path)
+            if match and match.group(1) in listed:
+                is_exportable = False
+            else:
+                is_exportable = self._is_exportable_dataframe(file_path, dataset_path)
+            batch.append((dataset_path, is_exportable))
+            if len(batch) == PROBE_BATCH_SIZE:
+                results.put(batch)
+                batch = []
+        if batch:
+            results.put(batch)
+        # Save any metadata the scan added to the file's sidecar in one write
+        self.file_handler.flush_sidecars()
+    
+    def _poll_exportability(self, future: Future, generation: int, results: queue.Queue) -> None:
+        """Style the datasets found exportable so far"""
+        # Tk widgets may only be touched from the main thread, so results
+        # are picked up here rather than in the worker
+        if generation != self._probe_generation:
+            return
+        # Results are all queued once the worker is done
+        finished = future.done()
+        
+        updated = False
+        while True:
+            try:
+                batch = results.get_nowait()
+            except queue.Empty:
+                break
+            for dataset_path, is_exportable in batch:
+                self._exportable_cache[dataset_path] = is_exportable
+                if is_exportable and self.tree and self.tree.exists(dataset_path):
+                    self.tree.item(dataset_path, tags=("exportable",))
+            updated = True
+        
+        if updated and self.tree:
+            self._update_summary(self.filtered_datasets)
+        if not finished:
+            self.parent.after(PROBE_POLL_MS, self._poll_exportability, future, generation, results)
+    
+    def _populate_dataset_tree(self, datasets: List[str]) -> None:
         """
-        Create buttons for the dataset list with styling based on exportability
+        Fill the dataset list, tagging datasets already found exportable for styling
         
         Args:
-            datasets: List of dataset paths to create buttons for
+            datasets: List of dataset paths to show
         """
-        # Clear existing buttons
-        for button in self.dataset_buttons:
-            button.destroy()
-        self.dataset_buttons.clear()
-        
-        # Create new buttons
-        exportable_count = 0
-        for i, dataset_path in enumerate(datasets):
-            # Check if dataset is exportable
-            is_exportable = self._is_exportable_dataframe(dataset_path)
-            if is_exportable:
-                exportable_count += 1
-            
-            # Choose button style based on exportability
-            if is_exportable:
-                # Use ttkbootstrap button with success style for exportable datasets
-                btn = ttkb.Button(
-                    self.scrollable_frame,
-                    text=f"{self._format_dataset_name(dataset_path)}",
-                    command=lambda path=dataset_path: self.callback(path),
-                    bootstyle="success",
-                    width=70
-                )
-            else:
-                # Use regular ttk button for non-exportable datasets
-                btn = ttk.Button(
-                    self.scrollable_frame,
-                    text=f"{self._format_dataset_name(dataset_path)}",
-                    command=lambda path=dataset_path: self.callback(path),
-                    width=70
-                )
-            
-            btn.grid(row=i, column=0, sticky=(tk.W, tk.E), padx=5, pady=3)
-            
-            # Add hover effect
-            self._add_hover_effect(btn)
-            
-            # Store button reference
-            self.dataset_buttons.append(btn)
+        # Clear existing rows
+        self.tree.delete(*self.tree.get_children())
+        
+        # Insert the current page's rows, keyed by dataset path
+        start_idx = self.current_page * DATASETS_PER_PAGE
+        for dataset_path in datasets[start_idx:start_idx + DATASETS_PER_PAGE]:
+            is_exportable = self._exportable_cache.get(dataset_path, False)
+            self.tree.insert("", "end", iid=dataset_path,
+                             text=self._format_dataset_name(dataset_path),
+                             tags=("exportable",) if is_exportable else ())
+        self.tree.yview_moveto(0)
+        
+        self._update_summary(datasets)
+        self._update_page_info(datasets)
+    
+    def _update_page_info(self, datasets: List[str]) -> None:
+        """
+        Show the page controls if the datasets don't fit on one page
+        
+        Args:
+            datasets: List of dataset paths shown
+        """
+        total_pages = max(1, (len(datasets) - 1) // DATASETS_PER_PAGE + 1)
+        if total_pages <= 1:
+            self.page_frame.grid_remove()
+        else:
+            self.page_label.config(text=f"Page {self.current_page + 1} of {total_pages}")
+            self.page_frame.grid()
+    
+    def _previous_page(self) -> None:
+        """Go to previous page"""
+        if self.current_page > 0:
+            self.current_page -= 1
+            self._populate_dataset_tree(self.filtered_datasets)
+    
+    def _next_page(self) -> None:
+        """Go to next page"""
+        if (self.current_page + 1) * DATASETS_PER_PAGE < len(self.filtered_datasets):
+            self.current_page += 1
+            self._populate_dataset_tree(self.filtered_datasets)
+    
+    def _update_summary(self, datasets: List[str]) -> None:
+        """
+        Show the number of listed datasets and how many are exportable
         
-        # Add summary label
+        Args:
+            datasets: List of dataset paths shown
+        """
+        exportable_count = sum(1 for dataset_path in datasets if self._exportable_cache.get(dataset_path))
+        
+        # Update summary label
+        summary_text = ""
         if datasets:
             summary_text = f"Total: {len(datasets)} dataset{'s' if len(datasets) != 1 else ''}"
             if exportable_count > 0:
                 summary_text += f" ({exportable_count} exportable)"
-                
-            count_label = ttk.Label(self.scrollable_frame, 
-                                  text=summary_text,
-                                  font=("TkDefaultFont", 8), foreground="gray")
-            count_label.grid(row=len(datasets), column=0, pady=(15, 5))
-            self.dataset_buttons.append(count_label)  # Store for cleanup
+        self.summary_label.config(text=summary_text)
     
     def _format_dataset_name(self, dataset_path: str) -> str:
         """
@@ -279,19 +379,18 @@ class DatasetList:
         
         return dataset_path
     
-    def _add_hover_effect(self, button) -> None:
-        """Add hover effect to button"""
-        def on_enter(e):
-            button.configure(cursor="hand2")
-        
-        def on_leave(e):
-            button.configure(cursor="")
-        
-        button.bind("<Enter>", on_enter)
-        button.bind("<Leave>", on_leave)
-    
     def _on_search_changed(self, *args) -> None:
-        """Handle search text changes"""
+        """Handle search text changes, filtering once typing pauses"""
+        if self._search_after_id:
+            self.search_entry.after_cancel(self._search_after_id)
+        self._search_after_id = self.search_entry.after(SEARCH_DEBOUNCE_MS, self._apply_search)
+    
+    def _apply_search(self) -> None:
+        """Filter the datasets by the current search text"""
+        if self._search_after_id:
+            self.search_entry.after_cancel(self._search_after_id)
+            self._search_after_id = None
+        
         search_text = self.search_var.get().lower()
         
         if not search_text:
@@ -300,12 +399,14 @@ class DatasetList:
         else:
             # Filter datasets
             self.filtered_datasets = [
-                dataset for dataset in self.datasets
-                if search_text in dataset.lower()
+                dataset for dataset, dataset_lower in zip(self.datasets, self._datasets_lower)
+                if search_text in dataset_lower
             ]
         
-        # Update button list
-        self._create_dataset_buttons(self.filtered_datasets)
+        # Update the list from its first page (the tree is created on the first update_datasets)
+        self.current_page = 0
+        if self.tree:
+            self._populate_dataset_tree(self.filtered_datasets)
     
     def _clear_search(self) -> None:
         """Clear the search field"""
@@ -320,41 +421,63 @@ class DatasetList:
             file_path: Path to the current file (for exportability checking)
         """
         self.datasets = datasets
+        self._datasets_lower = [dataset.lower() for dataset in datasets]
         self.filtered_datasets = datasets.copy()
+        self.current_page = 0
         self.current_file_path = file_path  # Store file path for exportability checking
+        self._exportable_cache.clear()
         
         # Hide no file message
         self._hide_no_file_message()
         
+        # Create scrollable list
+        self._create_scrollable_list()
+        
         # Show search bar if we have datasets
         if datasets:
             self.search_frame.grid()
-            self._clear_search()  # Clear any existing search
-        
-        # Create scrollable list
-        self._create_scrollable_list()
+            # Clear the search and fill the list right away
+            self._clear_search()
+            self._apply_search()
+        else:
+            self._populate_dataset_tree(datasets)
         
-        # Create dataset buttons with exportability styling
-        self._create_dataset_buttons(datasets)
+        # Exportable datasets are styled as the check finds them
+        self._start_exportability_check()
     
     def clear_datasets(self) -> None:
         """Clear all datasets and show no file message"""
         self.datasets.clear()
+        self._datasets_lower.clear()
         self.filtered_datasets.clear()
         self.current_file_path = None
+        self._exportable_cache.clear()
+        self._probe_generation += 1  # Stop any running exportability check
         
         # Hide search bar
         if hasattr(self, 'search_frame'):
             self.search_frame.grid_remove()
         
-        # Remove scroll container
+        # Empty and hide the list, keeping its widgets for the next file
         if self.scroll_container:
-            self.scroll_container.destroy()
-            self.scroll_container = None
+            self.tree.delete(*self.tree.get_children())
+            self.summary_label.config(text="")
+            self.scroll_container.grid_remove()
         
         # Show no file message
         self._show_no_file_message()
     
     def get_selected_datasets(self) -> List[str]:
         """Get the currently displayed (filtered) datasets"""
-        return self.filtered_datasets.copy()
\ No newline at end of file
+        return self.filtered_datasets.copy()
+    
+    def close(self) -> None:
+        """Stop the background exportability check and release the HDF5 files"""
+        # The running check stops at its next dataset; don't wait for it here.
+        # Its handler is released once it has stopped.
+        self._probe_generation += 1
+        self._probe_executor.shutdown(wait=False, cancel_futures=True)
+        if self._probe_future is None:
+            self.file_handler.close_all()
+        else:
+            self._probe_future.add_done_callback(lambda _: self.file_handler.close_all())
@@ -3,7 +3,6 @@ import ttkbootstrap as ttkb
 from ttkbootstrap.constants import *
 from ttkbootstrap.dialogs import Messagebox
 from tkinter import filedialog, END, W, E, NSEW, BOTH, LEFT, RIGHT, Y
-import pandas as pd
 from typing import List, Optional, Tuple, Any
 import math
 
@@ -54,8 +53,7 @@ class ExportWindow:
     def _setup_ui(self) -> None:
         main_frame = ttkb.Frame(self.dialog, padding=15)
         main_frame.pack(fill=BOTH, expand=True)
-        main_frame.grid_columnconfigure(0, weight=1)
-        main_frame.grid_columnconfigure(1, weight=1)
+        main_frame.grid_columnconfigure((0, 1), weight=1)
         main_frame.grid_rowconfigure(0, weight=1)
 
         # Left Panel: Item Selector (Columns)
@@ -147,9 +145,7 @@ class ExportWindow:
         # Bottom Panel: Export and Info
         bottom_frame = ttkb.Frame(main_frame, padding=(0, 10))
         bottom_frame.grid(row=1, column=0, columnspan=2, sticky=EW)
-        bottom_frame.grid_columnconfigure(0, weight=1)
-        bottom_frame.grid_columnconfigure(1, weight=1)
-        bottom_frame.grid_columnconfigure(2, weight=1)
+        bottom_frame.grid_columnconfigure((0, 1, 2), weight=1)
 
         self.preview_label = ttkb.Label(bottom_frame, text="Rows: 0 × Columns: 0", font=("Segoe UI", 10))
         self.preview_label.grid(row=0, column=0, sticky=W)
@@ -160,9 +156,9 @@ class ExportWindow:
     def _load_columns(self) -> None:
         try:
             # Use the updated get_dataset_info which now includes 'columns' for groups
-            info = self.file_handler.get_dataset_info(self.h5_file_path, self.dataset_path)
-            if 'columns' in info and info['columns']:
-                self.df_columns = info['columns']
+            info = self.file_handler.get_dataset_info(self.h5_file_path, self.dataset_path, include_columns=True)
+            if info.columns:
+                self.df_columns = info.columns
             else:
                 self.df_columns = [] # No columns found or not a tabular dataset
 
@@ -400,6 +396,8 @@ class ExportWindow:
         return sorted(list(set(rows))) # Remove duplicates and sort
 
     def _preview_export(self) -> None:
+        import pandas as pd
+
         selected_columns_count = len(self.selected_columns)
         row_selection_string = self.row_selection_entry.get()
         try:
@@ -412,8 +410,8 @@ class ExportWindow:
             # Get total rows from dataset info (assuming a 'shape' attribute)
             info = self.file_handler.get_dataset_info(self.h5_file_path, self.dataset_path)
             total_dataset_rows = 0
-            if 'shape' in info and isinstance(info['shape'], tuple) and len(info['shape']) > 0:
-                total_dataset_rows = info['shape'][0]
+            if isinstance(info.shape, tuple) and len(info.shape) > 0:
+                total_dataset_rows = info.shape[0]
             else:
                 # If shape not directly available, try to infer from data for preview
                 # This might involve reading a small part of the data which could be slow for very large files
@@ -2,6 +2,8 @@ import ttkbootstrap as ttkb
 from ttkbootstrap.constants import *
 from ttkbootstrap.dialogs import Messagebox
 from tkinter import filedialog
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from PIL import Image, ImageTk
 from pathlib import Path
 from typing import List, Optional
@@ -22,6 +24,10 @@ class MainWindow:
 
         self.file_handler = H5FileHandler()
         self.inspector = DatasetInspector(self.root)
+        # Files are scanned off the Tk thread. The handler's file and info
+        # caches aren't thread-safe, so both threads take this lock to use it.
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._handler_lock = threading.Lock()
 
         self._setup_window()
         self._setup_ui()
@@ -32,6 +38,8 @@ class MainWindow:
         self.root.geometry("750x600")
         self.root.resizable(True, True)
         self.root.minsize(600, 400)
+        # Stop background work and close the HDF5 files when the window is closed
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
         self.root.grid_rowconfigure(0, weight=1)
         self.root.grid_columnconfigure(0, weight=1)
 
@@ -105,12 +113,33 @@ class MainWindow:
         self.root.geometry(f"{width}x{height}+{x}+{y}")
 
     def _on_file_uploaded(self, file_path: str) -> None:
-        try:
+        # Validate and list the file on the worker so the window keeps
+        # redrawing while large files are scanned
+        self.root.config(cursor="watch")
+        future = self._executor.submit(self._load_file, file_path)
+        self.root.after(50, self._poll_file_load, future, file_path)
+
+    def _load_file(self, file_path: str) -> Optional[List[str]]:
+        """Runs on the worker thread: the file's datasets, or None if it isn't HDF5"""
+        with self._handler_lock:
             if not self.file_handler.validate_file(file_path):
+                return None
+            return self.file_handler.get_datasets(file_path)
+
+    def _poll_file_load(self, future: Future, file_path: str) -> None:
+        # Tk widgets may only be touched from the main thread, so the result
+        # is picked up here rather than in a done-callback
+        if not future.done():
+            self.root.after(50, self._poll_file_load, future, file_path)
+            return
+        self.root.config(cursor="")
+        try:
+            datasets = future.result()
+            if datasets is None:
                 Messagebox.show_error("Invalid HDF5 file format", title="Error")
                 return
 
-            self.datasets = self.file_handler.get_datasets(file_path)
+            self.datasets = datasets
             self.current_file = file_path
             
             # Pass the file path to dataset list so it can check exportability
@@ -169,12 +198,17 @@ class MainWindow:
         path_text = dataset_path if len(dataset_path) <= 60 else dataset_path[:57] + "..."
         ttkb.Label(info_frame, text=path_text, font=("Segoe UI", 10), bootstyle="info").pack(anchor=W, pady=(5, 0))
 
-        try:
-            info = self.file_handler.get_dataset_info(self.current_file, dataset_path)
-            info_text = f"Shape: {info['shape']}, Type: {info['dtype']}, Size: {info['size']:,} elements"
-            ttkb.Label(info_frame, text=info_text, font=("Segoe UI", 9), bootstyle="secondary").pack(anchor=W, pady=(5, 0))
-        except:
-            pass
+        # The summary line is optional, so it is skipped rather than waiting
+        # while the worker is scanning another file with the handler
+        if self._handler_lock.acquire(blocking=False):
+            try:
+                info = self.file_handler.get_dataset_info(self.current_file, dataset_path)
+                info_text = f"Shape: {info.shape}, Type: {info.dtype}, Size: {info.size:,} elements"
+                ttkb.Label(info_frame, text=info_text, font=("Segoe UI", 9), bootstyle="secondary").pack(anchor=W, pady=(5, 0))
+            except:
+                pass
+            finally:
+                self._handler_lock.release()
 
         button_frame = ttkb.Frame(main_frame)
         button_frame.pack()
@@ -227,6 +261,9 @@ class MainWindow:
 
     def close(self) -> None:
         self.inspector.close_inspector()
+        self.dataset_list.close()
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self.file_handler.close_all()
         self.root.quit()
         self.root.destroy()
 
@@ -3,13 +3,16 @@ import ttkbootstrap as ttkb
 from ttkbootstrap.constants import *
 from ttkbootstrap.dialogs import Messagebox
 from tkinter import filedialog, END, W, E, NSEW, BOTH, LEFT, RIGHT, Y
-import pandas as pd
 import math
-from typing import List, Optional, Any
+from typing import List, Optional, Any, TYPE_CHECKING
 
 from core.h5_file_handler import H5FileHandler
 from core.dataframe_exporter import DataFrameExporter
 
+# pandas is imported where the search runs, keeping it off the app's startup path
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 class SpecificInstanceExportWindow:
     def __init__(self, master: ttkb.Window, h5_file_path: str, dataset_path: str):
@@ -23,7 +26,7 @@ class SpecificInstanceExportWindow:
         self.df_columns: List[str] = []
         self.selected_column: Optional[str] = None
         self.search_value: str = ""
-        self.filtered_df: Optional[pd.DataFrame] = None
+        self.filtered_df: Optional['pd.DataFrame'] = None
         self.preview_rows: int = 0
         self.preview_columns: int = 0
 
@@ -60,8 +63,7 @@ class SpecificInstanceExportWindow:
         """Setup the user interface"""
         main_frame = ttkb.Frame(self.dialog, padding=15)
         main_frame.pack(fill=BOTH, expand=True)
-        main_frame.grid_columnconfigure(0, weight=1)
-        main_frame.grid_columnconfigure(1, weight=1)
+        main_frame.grid_columnconfigure((0, 1), weight=1)
         main_frame.grid_rowconfigure(0, weight=1)
 
         # Left Panel: Column Selection (borrowed structure from export window)
@@ -191,9 +193,7 @@ class SpecificInstanceExportWindow:
         # Bottom Panel: Export Controls
         bottom_frame = ttkb.Frame(main_frame, padding=(0, 15))
         bottom_frame.grid(row=1, column=0, columnspan=2, sticky=EW)
-        bottom_frame.grid_columnconfigure(0, weight=1)
-        bottom_frame.grid_columnconfigure(1, weight=1)
-        bottom_frame.grid_columnconfigure(2, weight=1)
+        bottom_frame.grid_columnconfigure((0, 1, 2), weight=1)
 
         # Status/Info
         self.status_label = ttkb.Label(
@@ -226,9 +226,9 @@ class SpecificInstanceExportWindow:
         """Load columns from the dataset (borrowed from export window)"""
         try:
             # Use the updated get_dataset_info which now includes 'columns' for groups
-            info = self.file_handler.get_dataset_info(self.h5_file_path, self.dataset_path)
-            if 'columns' in info and info['columns']:
-                self.df_columns = info['columns']
+            info = self.file_handler.get_dataset_info(self.h5_file_path, self.dataset_path, include_columns=True)
+            if info.columns:
+                self.df_columns = info.columns
             else:
                 self.df_columns = [] # No columns found or not a tabular dataset
 
@@ -448,6 +448,8 @@ class SpecificInstanceExportWindow:
 
     def _update_preview(self) -> None:
         """Update the preview based on current selection using chunk-based processing for large datasets"""
+        import pandas as pd
+        
         if not self.selected_column:
             self.preview_label.config(text="Please select a column first", bootstyle="warning")
             self.sample_text.config(state="normal")
@@ -484,8 +486,8 @@ class SpecificInstanceExportWindow:
             info = self.file_handler.get_dataset_info(self.h5_file_path, self.dataset_path)
             total_rows = 0
             
-            if 'shape' in info and isinstance(info['shape'], tuple) and len(info['shape']) > 0:
-                total_rows = info['shape'][0]
+            if isinstance(info.shape, tuple) and len(info.shape) > 0:
+                total_rows = info.shape[0]
             else:
                 # Try to get a quick sample to determine total rows
                 try: